@@ -0,0 +1,25 @@
+#!/bin/sh
+# 컨테이너 실행 스크립트
+# 큐 작업자(manage.py run_*_worker)를 백그라운드에서 실행하고 gunicorn 을 실행합니다.
+# 작업자가 종료되면 잠시 후 다시 실행합니다.
+set -e
+
+export DJANGO_SETTINGS_MODULE=${DJANGO_SETTINGS_MODULE:-ozet.settings.live}
+
+run_worker() {
+  while true; do
+    python manage.py "$@" || echo "$1 exited with code $?" >&2
+    sleep 5
+  done
+}
+
+# SMS 발송 큐
+run_worker run_sms_worker &
+
+# SMS 수신자별 발송 결과 조회 (잠금 없이 조회하므로 하나만 실행)
+run_worker run_sms_delivery_worker &
+
+# 이력서 PDF 변환 큐
+run_worker run_resume_pdf_worker --concurrency 2 &
+
+exec gunicorn ozet.asgi:application -b :8080 -k uvicorn.workers.UvicornWorker
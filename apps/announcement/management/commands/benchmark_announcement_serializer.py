@@ -0,0 +1,62 @@
+import time
+
+from apps.address.models import City
+from apps.announcement.models import Announcement, EmployeeType
+from apps.announcement.serializers import AnnouncementSerializer
+from django.core.management import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = "Measures AnnouncementSerializer(many=True) throughput for a list page (rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--rounds", type=int, default=50)
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        rounds = options["rounds"]
+
+        with transaction.atomic():
+            city = City.objects.create(name="benchmark")
+            employee_types = [
+                EmployeeType.objects.create(name=employee_type.value, codename=employee_type.name)
+                for employee_type in EmployeeType.Type
+            ]
+
+            announcements = Announcement.objects.bulk_create(
+                [
+                    Announcement(
+                        title=f"benchmark {i}",
+                        shop_name="shop",
+                        shop_location="location",
+                        city=city,
+                        manager_name="manager",
+                        manager_phone_number="+821012345678",
+                        expire_type=Announcement.ExpireType.ALWAYS,
+                        working_hour="10:00 ~ 20:00",
+                        pay_type=Announcement.PayType.MONTH,
+                        pay_amount=2500000,
+                        description="description",
+                        image_url="https://example.com/image.png",
+                    )
+                    for i in range(page_size)
+                ]
+            )
+            for announcement in Announcement.objects.filter(city=city):
+                announcement.employee_types.set(employee_types[:2])
+
+            page = list(AnnouncementSerializer.process_queryset(Announcement.objects.filter(city=city)))
+
+            started_at = time.monotonic()
+            for _ in range(rounds):
+                AnnouncementSerializer(page, many=True).data
+            elapsed = time.monotonic() - started_at
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"{len(announcements)} announcements x {rounds} rounds in {elapsed:.2f}s "
+            f"({elapsed / rounds * 1000:.2f}ms/page, {len(page) * rounds / elapsed:.0f} objects/s)"
+        )
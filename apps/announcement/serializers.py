@@ -2,15 +2,16 @@ from django.db.models import Count, Prefetch
 
 from apps.announcement.models import Announcement, Bookmark, EmployeeType
 from rest_framework import serializers
+from utils.django.rest_framework.serializers import CompiledRepresentationMixin
 
 
-class EmployeeTypeSerializer(serializers.ModelSerializer):
+class EmployeeTypeSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = EmployeeType
         fields = ["id", "name"]
 
 
-class AnnouncementSerializer(serializers.ModelSerializer):
+class AnnouncementSerializer(CompiledRepresentationMixin, serializers.ModelSerializer):
     employee_types = EmployeeTypeSerializer(many=True, default=[])
     bookmark_count = serializers.IntegerField()
 
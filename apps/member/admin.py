@@ -1,8 +1,9 @@
 from django.contrib import admin
-from apps.member.models import User, UserProfile, UserToken, UserPasscodeVerify
+from apps.member.models import SMSMessage, User, UserProfile, UserToken, UserPasscodeVerify
 
 # Register your models here.
 admin.site.register(User)
 admin.site.register(UserProfile)
 admin.site.register(UserToken)
-admin.site.register(UserPasscodeVerify)
\ No newline at end of file
+admin.site.register(UserPasscodeVerify)
+admin.site.register(SMSMessage)
\ No newline at end of file
@@ -0,0 +1,158 @@
+import hashlib
+import time
+from typing import Iterable, Optional
+
+from django.apps import apps
+from django.core.cache import cache
+from rest_framework_jwt.settings import api_settings
+
+
+def get_token_digest(token: str) -> str:
+    """
+    토큰 저장 / 조회에 사용하는 고정 길이(64자) sha256 digest
+    """
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+class UserTokenCache(object):
+    """
+    발급된 회원 토큰의 유효성 캐시
+
+    Notes:
+        토큰 원문 대신 sha256 digest 를 키로 사용하고, 값으로 토큰을 소유한 회원 id 를 저장합니다.
+        토큰이 발급될 때 기록되고, 만료(expire) 처리될 때 제거됩니다.
+    """
+    key_prefix = 'member:user_token'
+
+    @classmethod
+    def get_timeout(cls) -> int:
+        return int(api_settings.JWT_EXPIRATION_DELTA.total_seconds())
+
+    @classmethod
+    def get_key(cls, token: str) -> str:
+        return f'{cls.key_prefix}:{get_token_digest(token)}'
+
+    @classmethod
+    def get_user_id(cls, token: str) -> Optional[int]:
+        return cache.get(cls.get_key(token))
+
+    @classmethod
+    def set(cls, token: str, user_id: int) -> None:
+        cache.set(cls.get_key(token), user_id, timeout=cls.get_timeout())
+
+    @classmethod
+    def delete_many(cls, tokens: Iterable[str]) -> None:
+        keys = [cls.get_key(token) for token in tokens]
+        if keys:
+            cache.delete_many(keys)
+
+
+class UserCache(object):
+    """
+    인증된 회원(프로필 / 이력서 포함) 캐시
+
+    Notes:
+        회원별 버전 키를 두고, 버전이 올라가면 이전 버전의 캐시는 더 이상 조회되지 않습니다.
+        버전 키가 유실되면 현재 시각(ms) 기반으로 다시 초기화되어 이전 버전과 겹치지 않습니다.
+    """
+    key_prefix = 'member:user'
+    timeout = 60 * 60
+
+    @classmethod
+    def get_version_key(cls, user_id: int) -> str:
+        return f'{cls.key_prefix}:{user_id}:version'
+
+    @classmethod
+    def get_key(cls, user_id: int, version: int) -> str:
+        return f'{cls.key_prefix}:{user_id}:v{version}'
+
+    @classmethod
+    def get_version(cls, user_id: int) -> Optional[int]:
+        version_key = cls.get_version_key(user_id)
+
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, int(time.time() * 1000), timeout=None)
+            version = cache.get(version_key)
+
+        return version
+
+    @classmethod
+    def bump_version(cls, user_id: int) -> None:
+        version_key = cls.get_version_key(user_id)
+
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, int(time.time() * 1000), timeout=None)
+
+    @classmethod
+    def get(cls, user_id: int, version: int):
+        return cache.get(cls.get_key(user_id, version))
+
+    @classmethod
+    def set(cls, user, version: int) -> None:
+        """
+        Notes:
+            DB 조회 전에 가져온 버전으로 저장해야 조회 도중 발생한 변경이 캐시에 덮어써지지 않습니다.
+        """
+        cache.set(cls.get_key(user.id, version), user, timeout=cls.timeout)
+
+
+class ResumeUserCache(object):
+    """
+    이력서 id 로 회원 id 를 찾기 위한 캐시
+
+    Notes:
+        이력서는 회원과 1:1 로 생성된 이후 소유 회원이 바뀌지 않으므로 버전 없이 저장합니다.
+    """
+    key_prefix = 'member:resume_user'
+    timeout = 60 * 60 * 24
+
+    @classmethod
+    def get_key(cls, resume_id: int) -> str:
+        return f'{cls.key_prefix}:{resume_id}'
+
+    @classmethod
+    def get_user_id(cls, resume_id: int) -> Optional[int]:
+        key = cls.get_key(resume_id)
+
+        user_id = cache.get(key)
+        if user_id is None:
+            user_id = apps.get_model('resume', 'Resume').objects \
+                .filter(id=resume_id) \
+                .values_list('user_id', flat=True) \
+                .first()
+            if user_id is not None:
+                cache.set(key, user_id, timeout=cls.timeout)
+
+        return user_id
+
+
+class UserResponseCache(object):
+    """
+    회원 / 이력서 공개 조회 API 의 응답 데이터 캐시
+
+    Notes:
+        UserCache 의 회원별 버전을 키에 포함하므로, 회원 / 프로필 / 이력서가 변경되어 버전이 올라가면
+        이전 응답은 더 이상 조회되지 않습니다.
+        파일 URL 이 요청 host 로 만들어지므로 host 를 포함한 URL 을 키로 사용합니다.
+    """
+    key_prefix = 'member:user_response'
+    timeout = 60 * 60
+
+    @classmethod
+    def get_version(cls, user_id: int) -> Optional[int]:
+        return UserCache.get_version(user_id)
+
+    @classmethod
+    def get_key(cls, user_id: int, version: int, url: str) -> str:
+        return f'{cls.key_prefix}:{user_id}:v{version}:{hashlib.md5(url.encode("utf-8")).hexdigest()}'
+
+    @classmethod
+    def get(cls, user_id: int, version: int, url: str):
+        return cache.get(cls.get_key(user_id, version, url))
+
+    @classmethod
+    def set(cls, user_id: int, version: int, url: str, data) -> None:
+        cache.set(cls.get_key(user_id, version, url), data, timeout=cls.timeout)
@@ -19,6 +19,11 @@ class PasscodeVerifyPending(APIException):
     default_detail = _('이미 요청 대기중인 인증이 있습니다.')
 
 
+class PasscodeVerifyUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _('인증 요청을 처리할 수 없습니다. 잠시 후 다시 시도해주세요.')
+
+
 class PasscodeVerifyDoesNotExist(APIException):
     status_code = status.HTTP_401_UNAUTHORIZED
     default_detail = _('유효한 인증 요청이 존재하지 않습니다.')
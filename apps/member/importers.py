@@ -0,0 +1,31 @@
+import csv
+import io
+import json
+from typing import IO, Iterator, Literal
+
+USER_ROW_FIELDS = ('phone_number', 'username', 'name', 'email')
+
+
+def iter_user_rows(stream: IO[bytes], format: Literal['csv', 'jsonl']) -> Iterator[dict]:
+    """
+    회원 일괄 생성 입력 파일을 한 줄씩 읽어 dict 로 반환
+
+    Args:
+        stream: 바이너리 스트림 (UTF-8)
+        format: csv (헤더 포함) 또는 jsonl
+    """
+    text_stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+    if format == 'csv':
+        rows = csv.DictReader(text_stream)
+    elif format == 'jsonl':
+        rows = (json.loads(line) for line in text_stream if line.strip())
+    else:
+        raise ValueError(f'Unsupported format: {format}')
+
+    for row in rows:
+        yield {field: (row.get(field) or '').strip() or None for field in USER_ROW_FIELDS}
+
+
+def guess_format(file_name: str) -> Literal['csv', 'jsonl']:
+    return 'jsonl' if file_name.lower().endswith(('.jsonl', '.json')) else 'csv'
@@ -0,0 +1,78 @@
+import time
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from apps.member import serializers
+from apps.member.models import User
+
+
+class Command(BaseCommand):
+    """
+    회원 serializer 직렬화 처리량 측정
+
+    Notes:
+        측정용 회원은 하나의 트랜잭션 안에서 생성된 뒤 롤백되므로 데이터가 남지 않습니다.
+        DB 조회 비용을 제외하기 위해 회원 목록은 미리 조회해 둔 뒤 직렬화만 측정합니다.
+    """
+    help = '회원 serializer 의 직렬화 처리량(objects/s)을 측정합니다.'
+
+    serializer_classes = (
+        serializers.UserSerializer,
+        serializers.UserMeSerializer,
+        serializers.UserDetailsSerializer,
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=100,
+            help='직렬화할 회원 수',
+        )
+        parser.add_argument(
+            '--rounds',
+            type=int,
+            default=10,
+            help='반복 측정 횟수',
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        rounds = options['rounds']
+
+        with transaction.atomic():
+            # 실제 회원과 겹치지 않도록 사용되지 않는 010-0xxx 대역의 번호를 사용
+            user_ids = [
+                User.objects.get_or_create_by_phone_number(f'+82100{i:07d}')[0].id
+                for i in range(count)
+            ]
+            users = list(
+                User.objects
+                .filter(id__in=user_ids)
+                .select_related('profile', 'resume')
+                .prefetch_related('social_set')
+            )
+
+            for serializer_class in self.serializer_classes:
+                # many=True: 목록 직렬화
+                started_at = time.monotonic()
+                for _ in range(rounds):
+                    serializer_class(users, many=True).data
+                many_elapsed = time.monotonic() - started_at
+
+                # 회원마다 serializer 를 새로 생성 (상세 API 요청과 같은 형태)
+                started_at = time.monotonic()
+                for _ in range(rounds):
+                    for user in users:
+                        serializer_class(user).data
+                single_elapsed = time.monotonic() - started_at
+
+                total = len(users) * rounds
+                self.stdout.write(
+                    f'{serializer_class.__name__}: '
+                    f'many {total / many_elapsed:.0f} objects/s, '
+                    f'single {total / single_elapsed:.0f} objects/s'
+                )
+
+            transaction.set_rollback(True)
@@ -0,0 +1,50 @@
+import random
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.member.models import User
+
+
+class Command(BaseCommand):
+    """
+    가입 전 회원(Pre-SignUp) 생성 처리량 측정
+
+    Notes:
+        모든 생성은 하나의 트랜잭션 안에서 수행된 뒤 롤백되므로 데이터가 남지 않습니다.
+    """
+    help = '가입 전 회원 생성 처리량(signups/s)과 회원당 쿼리 수를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=100,
+            help='생성할 회원 수',
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        # 실제 회원과 겹치지 않도록 사용되지 않는 010-0xxx 대역의 번호를 사용
+        phone_numbers = [f'+82100{random.randint(0, 9999999):07d}' for _ in range(count)]
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as context:
+                started_at = time.monotonic()
+                for phone_number in phone_numbers:
+                    User.objects.get_or_create_by_phone_number(phone_number)
+                elapsed = time.monotonic() - started_at
+
+            transaction.set_rollback(True)
+
+        queries = [
+            query for query in context.captured_queries
+            if not query['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT'))
+        ]
+
+        self.stdout.write(
+            f'{count} signups in {elapsed:.2f}s '
+            f'({count / elapsed:.1f} signups/s, {len(queries) / count:.1f} queries/signup)'
+        )
@@ -0,0 +1,116 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from rest_framework_jwt.settings import api_settings
+
+from apps.member.models import UserPasscodeVerify, UserSocialToken, UserToken
+
+
+class Command(BaseCommand):
+    """
+    만료된 회원 토큰 / 소셜 토큰 / 패스코드 인증 요청 삭제
+
+    Notes:
+        id 순서로 batch 크기만큼 삭제 대상 id 를 조회한 뒤 해당 id 들만 삭제하여,
+        한 번의 DELETE 가 오래 잠금을 잡지 않도록 합니다.
+        batch 단위로 QuerySet.delete() 를 사용하므로 Collector 비용은 batch 크기로 제한되며,
+        post_delete 시그널(삭제된 토큰의 캐시 제거 등)과 on_delete=SET_NULL 처리가 그대로 적용됩니다.
+    """
+    help = '만료된 회원 토큰 / 소셜 토큰 / 패스코드 인증 요청을 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.MEMBER_PRUNE_BATCH_SIZE,
+            help='한 번에 삭제할 최대 row 수',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0,
+            help='batch 사이 대기 시간(초)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='삭제하지 않고 대상 row 수만 출력',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+
+        self.batch_size = options['batch_size']
+        self.sleep = options['sleep']
+        self.dry_run = options['dry_run']
+
+        self.prune(UserToken.objects.filter(self.get_user_token_condition(now)))
+        self.prune(UserSocialToken.objects.filter(self.get_user_social_token_condition(now)))
+        self.prune(UserPasscodeVerify.objects.filter(self.get_user_passcode_verify_condition(now)))
+
+    # noinspection PyMethodMayBeStatic
+    def get_user_token_condition(self, now) -> Q:
+        expired_before = now - settings.MEMBER_TOKEN_RETENTION
+        # JWT 자체의 만료 기간이 지난 토큰은 상태와 관계없이 더 이상 사용될 수 없음
+        issued_before = expired_before - api_settings.JWT_EXPIRATION_DELTA
+
+        return Q(status=UserToken.Status.expire, modified__lt=expired_before) | \
+            Q(created__lt=issued_before)
+
+    # noinspection PyMethodMayBeStatic
+    def get_user_social_token_condition(self, now) -> Q:
+        expired_before = now - settings.MEMBER_SOCIAL_TOKEN_RETENTION
+
+        return Q(status=UserSocialToken.Status.expire, modified__lt=expired_before) | \
+            Q(expire_at__lt=expired_before)
+
+    # noinspection PyMethodMayBeStatic
+    def get_user_passcode_verify_condition(self, now) -> Q:
+        expired_before = now - settings.MEMBER_PASSCODE_VERIFY_RETENTION
+
+        return Q(
+            status__in=[UserPasscodeVerify.Status.verified, UserPasscodeVerify.Status.expire],
+            modified__lt=expired_before,
+        ) | Q(expire_at__lt=expired_before)
+
+    def prune(self, queryset: QuerySet) -> int:
+        model = queryset.model
+        label = model._meta.label
+
+        if self.dry_run:
+            self.stdout.write(f'{label}: {queryset.count()} rows to delete')
+            return 0
+
+        deleted_count = 0
+        last_id = 0
+        started_at = time.monotonic()
+
+        while True:
+            # 이미 확인한 구간은 다시 읽지 않도록 id 커서로 진행
+            ids = list(
+                queryset
+                .filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', flat=True)[:self.batch_size]
+            )
+            if not ids:
+                break
+
+            _, deleted = model.objects.filter(id__in=ids).delete()
+            deleted_count += deleted.get(label, 0)
+            last_id = ids[-1]
+
+            if len(ids) < self.batch_size:
+                break
+
+            if self.sleep:
+                time.sleep(self.sleep)
+
+        elapsed = time.monotonic() - started_at
+        rate = deleted_count / elapsed if elapsed > 0 else 0
+        self.stdout.write(f'{label}: deleted {deleted_count} rows in {elapsed:.2f}s ({rate:.0f} rows/s)')
+
+        return deleted_count
@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand
+
+from apps.member.workers import SMSDeliveryWorker
+
+
+class Command(BaseCommand):
+    help = '접수된 SMS 의 수신자별 발송 결과를 조회합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='한 번에 조회할 최대 발송 요청 수',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='조회할 발송 요청이 없으면 종료',
+        )
+
+    def handle(self, *args, **options):
+        worker = SMSDeliveryWorker(batch_size=options['batch_size'])
+        worker.run(stop_when_empty=options['once'])
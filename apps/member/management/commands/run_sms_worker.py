@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand
+
+from apps.member.workers import SMSWorker
+
+
+class Command(BaseCommand):
+    help = '발송 대기중인 SMS 를 발송합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='한 번에 가져올 최대 메세지 수',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기중인 메세지가 없으면 종료',
+        )
+
+    def handle(self, *args, **options):
+        worker = SMSWorker(batch_size=options['batch_size'])
+        worker.run(stop_when_empty=options['once'])
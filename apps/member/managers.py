@@ -1,5 +1,14 @@
+import itertools
+import uuid
+from typing import Dict, Iterable, List, Tuple
+
+from django.apps import apps
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from phonenumber_field.phonenumber import to_python
 from phonenumbers import PhoneNumber
 from safedelete.managers import SafeDeleteManager
 
@@ -54,5 +63,142 @@ class UserManager(BaseUserManager, SafeDeleteManager):
 
         return u
 
+    def get_or_create_by_phone_number(self, phone_number: PhoneNumber) -> Tuple['User', bool]:
+        """
+        전화번호로 회원을 가져오고, 없을 경우 가입 전 회원(Pre-SignUp)을 생성
+
+        Notes:
+            회원 / 프로필 / 이력서 / 병역 / 접근 토큰 생성을 하나의 트랜잭션으로 처리합니다.
+            같은 전화번호로 동시에 요청된 경우 전화번호 unique 제약으로 한 요청만 생성되고,
+            나머지 요청은 생성된 회원(탈퇴한 회원일 경우 복구)을 다시 조회합니다.
+
+        Returns:
+            (user, created): 회원과 생성 여부
+        """
+        try:
+            return self.get(phone_number=phone_number), False
+        except self.model.DoesNotExist:
+            pass
+
+        try:
+            with transaction.atomic(using=self._db):
+                user = self.model(
+                    username=f"ozet_{uuid.uuid4().hex}",
+                    email=None,
+                    phone_number=phone_number,
+                    name=None,
+                )
+                user.save(using=self._db)
+                user.create_token()
+        except IntegrityError:
+            # 삭제 계정 복구
+            # @TODO: 이미 탈퇴한 회원이 전화번호를 바꾸고 새로운 사람이 가입할 경우에 대한 처리가 필요함
+            user = self.model.all_objects.get(phone_number=phone_number)
+            if user.is_deleted:
+                user.undelete()
+            return user, False
+
+        return user, True
+
+    def bulk_provision(self, rows: Iterable[dict], batch_size: int = 1000) -> Dict[str, int]:
+        """
+        회원을 프로필 / 이력서 / 병역 정보와 함께 일괄 생성
+
+        Args:
+            rows: phone_number(필수), username, name, email 을 가진 dict (스트리밍 가능)
+            batch_size: 한 번의 INSERT 로 생성할 회원 수
+
+        Returns:
+            stats: created(생성) / skipped(이미 존재) / invalid(유효하지 않은 전화번호) 수
+
+        Notes:
+            batch 단위로 트랜잭션을 나누어 bulk_create 하므로 save / post_save 시그널이 호출되지 않습니다.
+            MySQL 은 bulk_create 후 id 를 반환하지 않으므로 username / user_id 로 다시 조회합니다.
+        """
+        stats = dict(created=0, skipped=0, invalid=0)
+
+        rows = iter(rows)
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                break
+
+            users = []
+            for row in batch:
+                phone_number = to_python(row.get('phone_number'), region='KR')
+                if not phone_number or not phone_number.is_valid():
+                    stats['invalid'] += 1
+                    continue
+
+                users.append(self.model(
+                    username=row.get('username') or f"ozet_{uuid.uuid4().hex}",
+                    phone_number=phone_number.as_e164,
+                    name=row.get('name') or None,
+                    email=row.get('email') or None,
+                ))
+
+            created_count = self._bulk_provision_batch(users)
+            stats['created'] += created_count
+            stats['skipped'] += len(users) - created_count
+
+        return stats
+
+    def _bulk_provision_batch(self, users: List['User']) -> int:
+        UserProfile = apps.get_model('member', 'UserProfile')
+        Resume = apps.get_model('resume', 'Resume')
+        MilitaryService = apps.get_model('resume', 'MilitaryService')
+
+        # 이미 존재하는(탈퇴 포함) 전화번호 / 아이디 및 같은 batch 내 중복 제외
+        existing = self.model.all_objects \
+            .filter(
+                Q(phone_number__in=[str(user.phone_number) for user in users]) |
+                Q(username__in=[user.username for user in users])
+            ) \
+            .values_list('phone_number', 'username')
+        seen = set(itertools.chain.from_iterable((str(phone_number), username) for phone_number, username in existing))
+
+        new_users = []
+        for user in users:
+            keys = (str(user.phone_number), user.username)
+            if seen.intersection(keys):
+                continue
+            seen.update(keys)
+
+            user.set_unusable_password()
+            new_users.append(user)
+
+        if not new_users:
+            return 0
+
+        now = timezone.now()
+        with transaction.atomic(using=self._db):
+            # 동시에 생성된 회원과의 충돌은 무시
+            self.bulk_create(new_users, ignore_conflicts=True)
+
+            user_ids = list(
+                self.model.all_objects
+                .filter(username__in=[user.username for user in new_users])
+                .values_list('id', flat=True)
+            )
+
+            UserProfile.objects.bulk_create(
+                [
+                    UserProfile(user_id=user_id, policy_for_terms_agreed=now, policy_for_privacy_agreed=now)
+                    for user_id in user_ids
+                ],
+                ignore_conflicts=True,
+            )
+            Resume.objects.bulk_create([Resume(user_id=user_id) for user_id in user_ids], ignore_conflicts=True)
+
+            resume_ids = Resume.objects \
+                .filter(user_id__in=user_ids) \
+                .values_list('id', flat=True)
+            MilitaryService.objects.bulk_create(
+                [MilitaryService(resume_id=resume_id) for resume_id in resume_ids],
+                ignore_conflicts=True,
+            )
+
+        return len(user_ids)
+
     def get_by_natural_key(self, username):
         return self.get(username=username)
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 20:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0026_alter_socialimagecollection_social_user'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usertoken',
+            name='token',
+            field=models.CharField(max_length=512, unique=True, verbose_name='토큰'),
+        ),
+    ]
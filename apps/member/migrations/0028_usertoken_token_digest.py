@@ -0,0 +1,52 @@
+# Generated by Django 3.2.6 on 2026-10-18 21:12
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def fill_token_digest(apps, schema_editor):
+    UserToken = apps.get_model('member', 'UserToken')
+
+    batch_size = 1000
+    user_tokens = []
+    for user_token in UserToken.objects.only('id', 'token').iterator(chunk_size=batch_size):
+        user_token.token_digest = hashlib.sha256(user_token.token.encode('utf-8')).hexdigest()
+        user_tokens.append(user_token)
+
+        if len(user_tokens) >= batch_size:
+            UserToken.objects.bulk_update(user_tokens, ['token_digest'])
+            user_tokens = []
+
+    if user_tokens:
+        UserToken.objects.bulk_update(user_tokens, ['token_digest'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0027_alter_usertoken_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usertoken',
+            name='token_digest',
+            field=models.CharField(editable=False, max_length=64, null=True, verbose_name='토큰 digest'),
+        ),
+        migrations.RunPython(fill_token_digest, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='usertoken',
+            name='token_digest',
+            field=models.CharField(editable=False, max_length=64, unique=True, verbose_name='토큰 digest'),
+        ),
+        migrations.AlterField(
+            model_name='usertoken',
+            name='token',
+            field=models.CharField(max_length=512, verbose_name='토큰'),
+        ),
+        migrations.AddIndex(
+            model_name='usertoken',
+            index=models.Index(fields=['user', 'type', 'status', 'created'], name='member_user_user_id_b9dd6b_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.6 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0028_usertoken_token_digest'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userpasscodeverify',
+            index=models.Index(fields=['user', 'created'], name='member_user_user_id_889e6f_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.2.6 on 2026-10-18 20:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import phonenumber_field.modelfields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0029_userpasscodeverify_user_created_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SMSMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('status', models.CharField(choices=[('queued', '대기중'), ('processing', '처리중'), ('done', '완료됨'), ('failed', '실패함')], default='queued', max_length=20, verbose_name='처리 상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='다음 시도 시간')),
+                ('last_error', models.TextField(blank=True, default=None, null=True, verbose_name='마지막 에러')),
+                ('phone_number', phonenumber_field.modelfields.PhoneNumberField(max_length=32, region=None, verbose_name='수신자 전화번호')),
+                ('subject', models.CharField(blank=True, default=None, max_length=40, null=True, verbose_name='제목')),
+                ('content', models.TextField(verbose_name='내용')),
+                ('expire_at', models.DateTimeField(blank=True, default=None, null=True, verbose_name='발송 만료 시간')),
+                ('sent_at', models.DateTimeField(blank=True, default=None, null=True, verbose_name='발송 시간')),
+                ('passcode_verify', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sms_message_set', to='member.userpasscodeverify', verbose_name='패스코드 인증 요청')),
+            ],
+            options={
+                'verbose_name': 'SMS 발송',
+                'verbose_name_plural': 'SMS 발송 목록',
+                'db_table': 'member_sms_message',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='smsmessage',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='member_sms__status_d85a43_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0030_smsmessage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='smsmessage',
+            name='request_id',
+            field=models.CharField(blank=True, default=None, max_length=64, null=True, verbose_name='발송 요청 ID'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 3.2.6 on 2026-10-18 21:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0031_smsmessage_request_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='smsmessage',
+            name='passcode_user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='passcode_sms_message_set', to=settings.AUTH_USER_MODEL, verbose_name='패스코드 인증 회원'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.2.6 on 2026-10-18 21:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0032_smsmessage_passcode_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userpasscodeverify',
+            index=models.Index(fields=['status', 'modified'], name='member_user_status_098417_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userpasscodeverify',
+            index=models.Index(fields=['expire_at'], name='member_user_expire__550c6a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersocialtoken',
+            index=models.Index(fields=['status', 'modified'], name='member_user_status_c99e08_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersocialtoken',
+            index=models.Index(fields=['expire_at'], name='member_user_expire__f859a4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertoken',
+            index=models.Index(fields=['status', 'modified'], name='member_user_status_2d70a4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertoken',
+            index=models.Index(fields=['created'], name='member_user_created_622173_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.6 on 2026-10-18 21:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('member', '0033_prune_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='smsmessage',
+            name='delivery_status',
+            field=models.CharField(blank=True, choices=[('pending', '결과 대기'), ('delivered', '발송 성공'), ('failed', '발송 실패'), ('unknown', '결과 알 수 없음')], default=None, max_length=20, null=True, verbose_name='수신자별 발송 결과'),
+        ),
+        migrations.AddField(
+            model_name='smsmessage',
+            name='message_id',
+            field=models.CharField(blank=True, default=None, max_length=64, null=True, verbose_name='수신자별 메세지 ID'),
+        ),
+        migrations.AddIndex(
+            model_name='smsmessage',
+            index=models.Index(fields=['delivery_status', 'modified'], name='member_sms__deliver_8f4121_idx'),
+        ),
+    ]
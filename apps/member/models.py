@@ -1,5 +1,5 @@
 import os
-from typing import List, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from random import randint
 
@@ -8,6 +8,7 @@ from djchoices import DjangoChoices, ChoiceItem
 from model_utils.fields import AutoCreatedField
 from phonenumber_field.modelfields import PhoneNumberField
 
+from django.conf import settings
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.base_user import AbstractBaseUser
@@ -15,10 +16,11 @@ from django.db import models, transaction
 from rest_auth.utils import jwt_encode
 from rest_framework_jwt.utils import jwt_decode_handler
 
+from apps.member.caches import UserTokenCache, get_token_digest
 from apps.member.managers import UserManager
 from apps.member import storages
 from apps.resume.models import Resume, MilitaryService
-from utils.django.models import SafeDeleteModel, TimeStampedModel
+from utils.django.models import QueuedTaskModel, SafeDeleteModel, TimeStampedModel
 
 
 # Create your models here.
@@ -114,22 +116,17 @@ class User(AbstractBaseUser, SafeDeleteModel, TimeStampedModel):
         if not self.id:
             rv = super(User, self).save(*args, **kwargs)
 
-            UserProfile.objects.create(user_id=self.id,
+            # 연관 객체를 인스턴스로 할당하여 self.profile / self.resume 이 추가 조회 없이 캐시됨
+            UserProfile.objects.create(user=self,
                                        policy_for_terms_agreed=self.created,
                                        policy_for_privacy_agreed=self.created)
 
-            Resume.objects.create(user_id=self.id)
+            Resume.objects.create(user=self)
 
             return rv
 
-        old_instance = User.objects.filter(id=self.id).first()
-        if not old_instance:
-            return super(User, self).save(*args, **kwargs)
-
-        # 업데이트
-        rv = super(User, self).save(*args, **kwargs)
-
-        return rv
+        # 업데이트 (변경된 필드만 저장됨)
+        return super(User, self).save(*args, **kwargs)
 
     @property
     def is_staff(self):
@@ -144,29 +141,53 @@ class User(AbstractBaseUser, SafeDeleteModel, TimeStampedModel):
         return True
 
     def is_valid_token(self, token: str):
+        # 캐시에 기록된 토큰은 DB 조회 없이 유효 처리
+        if UserTokenCache.get_user_id(token) == self.id:
+            return True
+
+        # 만료 처리된 토큰은 캐시에서 제거되므로 DB 에서도 유효한 토큰만 허용
         try:
-            self.token_set.get(token=token)
+            user_token = self.token_set.get(
+                token_digest=get_token_digest(token),
+                status=UserToken.Status.available,
+            )
         except UserToken.DoesNotExist:
             return False
+
+        UserTokenCache.set(user_token.token, self.id)
+
         return True
 
+    def create_token(self, token_type: ChoiceItem = None) -> 'UserToken':
+        """
+        기존 토큰을 만료 처리하지 않고 새로운 토큰을 발급 (발급된 토큰이 없는 신규 회원 등)
+        """
+        user_token = UserToken.objects.create(
+            user=self,
+            token=jwt_encode(self),
+            type=token_type or UserToken.Type.access,
+        )
+
+        transaction.on_commit(lambda: UserTokenCache.set(user_token.token, self.id))
+
+        return user_token
+
     def refresh_token(self, token_type: ChoiceItem, is_transaction=True):
         def _process():
-            self.token_set \
+            expired_token_queryset = self.token_set \
                 .filter(
-                    type=token_type
-                ) \
-                .update(
-                    status=UserToken.Status.expire,
+                    type=token_type,
+                    status=UserToken.Status.available,
                 )
 
-            user_token = UserToken.objects.create(
-                user_id=self.id,
-                token=jwt_encode(self),
-                type=token_type
+            expired_tokens = list(expired_token_queryset.values_list('token', flat=True))
+            expired_token_queryset.update(
+                status=UserToken.Status.expire,
             )
+            # 커밋 전에 제거하면 동시 요청이 커밋 전의 유효한 토큰을 다시 캐시할 수 있으므로 커밋 이후 제거
+            transaction.on_commit(lambda: UserTokenCache.delete_many(expired_tokens))
 
-            return user_token
+            return self.create_token(token_type)
 
         if is_transaction:
             with transaction.atomic():
@@ -174,6 +195,61 @@ class User(AbstractBaseUser, SafeDeleteModel, TimeStampedModel):
 
         return _process()
 
+    def get_valid_tokens(
+            self,
+            token_types: Optional[Iterable[ChoiceItem]] = None,
+            auto_generate=False,
+            is_transaction=True,
+            is_jwt_handle_self=False
+    ) -> Dict[str, 'UserToken']:
+        """
+        유효한 토큰을 형태별로 한 번의 쿼리로 가져옴
+
+        Args:
+            token_types: 토큰 형태 목록 (기본값: 전체)
+            auto_generate: 유효하지 않을 경우 재생성 여부
+            is_transaction: 트랜잭션 atomic 처리 여부
+            is_jwt_handle_self: jwt 에러를 직접 헨들링 할지에 대한 여부
+
+        Returns:
+            valid_tokens: 토큰 형태별 유효한 토큰
+        """
+        token_types = list(token_types or [UserToken.Type.access, UserToken.Type.refresh])
+
+        # (user, type, status, created) 인덱스로 유효한 토큰만 조회
+        user_tokens = self.token_set \
+            .filter(
+                type__in=token_types,
+                status=UserToken.Status.available,
+            ) \
+            .order_by('-created')
+
+        valid_tokens = {}
+        for user_token in user_tokens:
+            valid_tokens.setdefault(user_token.type, user_token)
+
+        for token_type in token_types:
+            valid_token = valid_tokens.get(token_type)
+
+            payload = None
+            if valid_token:
+                if is_jwt_handle_self:
+                    payload = jwt_decode_handler(valid_token.token)
+                else:
+                    try:
+                        payload = jwt_decode_handler(valid_token.token)
+                    except jwt.ExpiredSignature:
+                        payload = None
+                    except jwt.DecodeError:
+                        payload = None
+                    except jwt.InvalidTokenError:
+                        payload = None
+
+            if auto_generate and (not valid_token or not payload):
+                valid_tokens[token_type] = self.refresh_token(token_type, is_transaction)
+
+        return valid_tokens
+
     def get_valid_token(
             self,
             token_type: ChoiceItem,
@@ -193,37 +269,27 @@ class User(AbstractBaseUser, SafeDeleteModel, TimeStampedModel):
         Returns:
             valid_token: 유효한 토큰
         """
-        valid_token = self.token_set \
-            .filter(type=token_type) \
-            .order_by('-created') \
-            .first()
+        valid_tokens = self.get_valid_tokens(
+            [token_type],
+            auto_generate=auto_generate,
+            is_transaction=is_transaction,
+            is_jwt_handle_self=is_jwt_handle_self,
+        )
 
-        if valid_token:
-            if is_jwt_handle_self:
-                payload = jwt_decode_handler(valid_token.token)
-            else:
-                try:
-                    payload = jwt_decode_handler(valid_token.token)
-                except jwt.ExpiredSignature:
-                    payload = None
-                except jwt.DecodeError:
-                    payload = None
-                except jwt.InvalidTokenError:
-                    payload = None
-
-        if auto_generate and ( \
-            not valid_token or \
-            not payload or \
-            valid_token.status == UserToken.Status.expire
-        ):
-            valid_token = self.refresh_token(token_type, is_transaction)
-
-
-        return valid_token
-
-    def get_latest_passcode_verify(self):
-        request_passcode_verify = UserPasscodeVerify.objects \
-            .filter(user=self) \
+        return valid_tokens.get(token_type)
+
+    def get_latest_passcode_verify(self, for_update=False):
+        """
+        가장 최근의 패스코드 인증 요청을 가져옴
+
+        Args:
+            for_update: 트랜잭션 내에서 행 잠금(select_for_update) 여부
+        """
+        queryset = UserPasscodeVerify.objects.filter(user=self)
+        if for_update:
+            queryset = queryset.select_for_update()
+
+        request_passcode_verify = queryset \
             .order_by('-created') \
             .first()
 
@@ -424,11 +490,18 @@ class UserToken(TimeStampedModel):
         verbose_name=_('회원'),
     )
     token = models.CharField(
-        max_length=255,
+        max_length=512,
         null=False,
         blank=False,
         verbose_name=_('토큰'),
+    )
+    token_digest = models.CharField(
+        max_length=64,
+        null=False,
+        blank=False,
         unique=True,
+        editable=False,
+        verbose_name=_('토큰 digest'),
     )
     type = models.CharField(
         null=False,
@@ -453,6 +526,19 @@ class UserToken(TimeStampedModel):
 
         db_table = 'member_user_token'
 
+        indexes = [
+            models.Index(fields=['user', 'type', 'status', 'created']),
+            # prune_member_records
+            models.Index(fields=['status', 'modified']),
+            models.Index(fields=['created']),
+        ]
+
+    def save(self, *args, **kwargs):
+        # 토큰 원문 대신 고정 길이 digest 로 유일성 보장 및 조회
+        self.token_digest = get_token_digest(self.token)
+
+        return super(UserToken, self).save(*args, **kwargs)
+
     def __str__(self):
         return self.__repr__()
 
@@ -514,6 +600,12 @@ class UserSocialToken(TimeStampedModel):
 
         db_table = 'member_user_social_token'
 
+        indexes = [
+            # prune_member_records
+            models.Index(fields=['status', 'modified']),
+            models.Index(fields=['expire_at']),
+        ]
+
     def __str__(self):
         return self.__repr__()
 
@@ -579,12 +671,22 @@ class UserPasscodeVerify(TimeStampedModel):
         verbose_name=_('만료 시간'),
     )
 
+    # 인증 요청 유효 시간
+    expire_delta = timedelta(minutes=3)
+
     class Meta:
         verbose_name = _('회원 패스코드 인증 요청')
         verbose_name_plural = _('회원 패스코드 인증 요청')
 
         db_table = 'member_user_passcode_verify'
 
+        indexes = [
+            models.Index(fields=['user', 'created']),
+            # prune_member_records
+            models.Index(fields=['status', 'modified']),
+            models.Index(fields=['expire_at']),
+        ]
+
     def __str__(self):
         return self.__repr__()
 
@@ -607,51 +709,231 @@ class UserPasscodeVerify(TimeStampedModel):
         if latest_passcode_verify is None:
             return True
 
-        def __process():
-            if latest_passcode_verify.status == cls.Status.pending and \
-               (
-                    not latest_passcode_verify.expire_at or
-                        latest_passcode_verify.expire_at <= timezone.now()
-               ):
-                latest_passcode_verify.status = cls.Status.expire
-                latest_passcode_verify.save(update_fields=['status'])
-
         if is_transaction:
             with transaction.atomic():
-                __process()
+                cls.expire_if_due(latest_passcode_verify)
         else:
-            __process()
+            cls.expire_if_due(latest_passcode_verify)
 
         return latest_passcode_verify.status == cls.Status.expire
 
     @classmethod
     def get_expire_at(cls):
-        return timezone.now() + timedelta(minutes=3)
+        return timezone.now() + cls.expire_delta
+
+    @classmethod
+    def expire_if_due(cls, passcode_verify: Optional['UserPasscodeVerify']) -> None:
+        """
+        검증 대기중이지만 만료 시간이 지난 인증 요청을 만료 처리
+        """
+        if not passcode_verify or passcode_verify.status != cls.Status.pending:
+            return
+
+        if not passcode_verify.expire_at or passcode_verify.expire_at <= timezone.now():
+            passcode_verify.status = cls.Status.expire
+            passcode_verify.save(update_fields=['status'])
+
+    @classmethod
+    def request(
+            cls,
+            user: User,
+            requester_phone_number,
+            requester_device_uuid: str,
+            passcode: Union[int, str],
+    ) -> Tuple['UserPasscodeVerify', bool]:
+        """
+        최근 인증 요청을 잠금 조회하여 만료 처리 / 중복 확인 후 새로운 인증 요청을 생성
+
+        Returns:
+            (passcode_verify, created): 검증 대기중인 요청이 있으면 해당 요청과 False
+        """
+        with transaction.atomic():
+            latest_passcode_verify = user.get_latest_passcode_verify(for_update=True)
+            cls.expire_if_due(latest_passcode_verify)
+
+            # 중복 인증
+            if latest_passcode_verify and latest_passcode_verify.status == cls.Status.pending:
+                return latest_passcode_verify, False
+
+            passcode_verify = cls.objects.create(
+                requester_phone_number=requester_phone_number,
+                requester_device_uuid=requester_device_uuid,
+                user=user,
+                passcode=passcode,
+                expire_at=cls.get_expire_at(),
+            )
+
+        return passcode_verify, True
 
     @classmethod
     def verify(
             cls,
             user: User,
             passcode: Union[int, str],
-            is_transaction=True,
-    ) -> bool:
-        latest_passcode_verify = user.get_latest_passcode_verify()
+    ) -> Tuple[Optional['UserPasscodeVerify'], bool]:
+        """
+        최근 인증 요청을 잠금 조회하여 만료 처리 후 패스코드를 검증
 
-        if not latest_passcode_verify or latest_passcode_verify.status != cls.Status.pending:
-            return False
+        Returns:
+            (passcode_verify, verified): 최근 인증 요청과 검증 성공 여부
+        """
+        with transaction.atomic():
+            latest_passcode_verify = user.get_latest_passcode_verify(for_update=True)
+            cls.expire_if_due(latest_passcode_verify)
 
-        def __process():
-            if latest_passcode_verify.passcode == passcode:
-                latest_passcode_verify.status = cls.Status.verified
-                latest_passcode_verify.save(update_fields=['status'])
+            if not latest_passcode_verify or latest_passcode_verify.status != cls.Status.pending:
+                return latest_passcode_verify, False
 
-        if is_transaction:
-            with transaction.atomic():
-                __process()
-        else:
-            __process()
+            if latest_passcode_verify.passcode != str(passcode):
+                return latest_passcode_verify, False
+
+            latest_passcode_verify.status = cls.Status.verified
+            latest_passcode_verify.save(update_fields=['status'])
+
+        return latest_passcode_verify, True
+
+
+class SMSMessage(QueuedTaskModel):
+    """
+    발송 대기중인 SMS
+
+    Notes:
+        요청 처리 중에는 저장만 하고, run_sms_worker 작업자가 발송 및 재시도를 처리합니다.
+        SMS_QUEUE_EAGER 가 설정되어 있으면 커밋 이후 즉시 현재 프로세스에서 발송합니다. (테스트 용도)
+        접수(status=done) 이후의 수신자별 결과는 run_sms_delivery_worker 작업자가 조회하여 delivery_status 에 기록합니다.
+    """
+    class DeliveryStatus(DjangoChoices):
+        pending = ChoiceItem('pending', label=_('결과 대기'))
+        delivered = ChoiceItem('delivered', label=_('발송 성공'))
+        failed = ChoiceItem('failed', label=_('발송 실패'))
+        unknown = ChoiceItem('unknown', label=_('결과 알 수 없음'))
+
+    phone_number = PhoneNumberField("수신자 전화번호", max_length=32)
+    subject = models.CharField(
+        max_length=40,
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_('제목'),
+    )
+    content = models.TextField(
+        null=False,
+        blank=False,
+        verbose_name=_('내용'),
+    )
+
+    expire_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_('발송 만료 시간'),
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_('발송 시간'),
+    )
+    request_id = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_('발송 요청 ID'),
+    )
+    message_id = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_('수신자별 메세지 ID'),
+    )
+    delivery_status = models.CharField(
+        max_length=20,
+        null=True,
+        blank=True,
+        default=None,
+        choices=DeliveryStatus.choices,
+        verbose_name=_('수신자별 발송 결과'),
+    )
+
+    # Related
+    passcode_verify = models.ForeignKey(
+        UserPasscodeVerify,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='sms_message_set',
+        verbose_name=_('패스코드 인증 요청'),
+    )
+    # 캐시 저장소의 인증 요청은 저장되지 않으므로 회원 / 발송 만료 시간으로 찾음
+    passcode_user = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='passcode_sms_message_set',
+        verbose_name=_('패스코드 인증 회원'),
+    )
+
+    class Meta:
+        verbose_name = _('SMS 발송')
+        verbose_name_plural = _('SMS 발송 목록')
+
+        db_table = 'member_sms_message'
+
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+            # run_sms_delivery_worker
+            models.Index(fields=['delivery_status', 'modified']),
+        ]
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return f'<{self._meta.verbose_name.title()}: {self.phone_number} ({self.status})>'
+
+    @classmethod
+    def enqueue(
+            cls,
+            phone_number,
+            content: str,
+            subject: Optional[str] = None,
+            expire_at: Optional[datetime] = None,
+            passcode_verify: Optional[UserPasscodeVerify] = None,
+            passcode_user: Optional[User] = None,
+    ) -> 'SMSMessage':
+        sms_message = cls.objects.create(
+            phone_number=phone_number,
+            subject=subject,
+            content=content,
+            expire_at=expire_at,
+            passcode_verify=passcode_verify,
+            passcode_user=passcode_user,
+        )
+
+        if settings.SMS_QUEUE_EAGER:
+            from apps.member.workers import SMSWorker
+            transaction.on_commit(lambda: SMSWorker().run_once())
+
+        return sms_message
+
+    @classmethod
+    def enqueue_many(cls, sms_messages: List['SMSMessage']) -> List['SMSMessage']:
+        """
+        여러 SMS 를 한 번의 INSERT 로 발송 큐에 저장 (알림 발송 등)
+
+        Args:
+            sms_messages: 저장되지 않은 SMSMessage 목록
+        """
+        sms_messages = cls.objects.bulk_create(sms_messages)
+
+        if settings.SMS_QUEUE_EAGER:
+            from apps.member.workers import SMSWorker
+            transaction.on_commit(lambda: SMSWorker().run(stop_when_empty=True))
 
-        return latest_passcode_verify.status == cls.Status.verified
+        return sms_messages
 
 
 class SocialImageCollection(TimeStampedModel):
@@ -0,0 +1,173 @@
+from typing import Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.member.exceptions import PasscodeVerifyUnavailable
+from apps.member.models import User, UserPasscodeVerify
+from utils.django.background import run_in_background
+
+
+class BasePasscodeBackend(object):
+    """
+    패스코드 인증 요청 저장소
+
+    Notes:
+        request / verify 는 UserPasscodeVerify.request / verify 와 같은 형태의 결과를 반환합니다.
+    """
+
+    def request(
+            self,
+            user: User,
+            requester_phone_number,
+            requester_device_uuid: str,
+            passcode: Union[int, str],
+    ) -> Tuple[UserPasscodeVerify, bool]:
+        raise NotImplementedError
+
+    def verify(self, user: User, passcode: Union[int, str]) -> Tuple[Optional[UserPasscodeVerify], bool]:
+        raise NotImplementedError
+
+    def expire(self, passcode_verify: UserPasscodeVerify) -> None:
+        raise NotImplementedError
+
+
+class DatabasePasscodeBackend(BasePasscodeBackend):
+    """
+    member_user_passcode_verify 테이블에 인증 요청을 저장
+    """
+
+    def request(self, user, requester_phone_number, requester_device_uuid, passcode):
+        return UserPasscodeVerify.request(
+            user,
+            requester_phone_number=requester_phone_number,
+            requester_device_uuid=requester_device_uuid,
+            passcode=passcode,
+        )
+
+    def verify(self, user, passcode):
+        return UserPasscodeVerify.verify(user, passcode)
+
+    def expire(self, passcode_verify):
+        passcode_verify.status = UserPasscodeVerify.Status.expire
+        passcode_verify.save(update_fields=['status'])
+
+
+class CachePasscodeBackend(BasePasscodeBackend):
+    """
+    검증 대기중인 인증 요청을 캐시에 저장하고, 만료는 캐시 TTL 에 맡김
+
+    Notes:
+        회원당 하나의 키만 사용하며 cache.add 로 중복 요청을, cache.delete 결과로 중복 검증을 막습니다.
+        member_user_passcode_verify 에는 감사 기록만 백그라운드로 남깁니다.
+        감사 기록은 하나의 작업자에서 순서대로 기록되므로 요청 기록이 검증 기록보다 먼저 반영됩니다.
+        캐시에서 만료된 요청의 감사 기록은 검증 대기중 상태로 남으며, expire_at 으로 만료 여부를 판단합니다.
+        캐시 장애시에는 중복 요청을 확인할 수 없으므로 인증 요청을 받지 않습니다.
+    """
+    key_prefix = 'member:passcode'
+
+    @classmethod
+    def get_key(cls, user_id: int) -> str:
+        return f'{cls.key_prefix}:{user_id}'
+
+    @classmethod
+    def get_timeout(cls) -> int:
+        return int(UserPasscodeVerify.expire_delta.total_seconds())
+
+    @classmethod
+    def to_instance(cls, user: User, data: dict, status: str) -> UserPasscodeVerify:
+        return UserPasscodeVerify(
+            user=user,
+            requester_phone_number=data['requester_phone_number'],
+            requester_device_uuid=data['requester_device_uuid'],
+            passcode=data['passcode'],
+            expire_at=data['expire_at'],
+            status=status,
+        )
+
+    def add(self, key: str, data: dict) -> bool:
+        """
+        Raises:
+            PasscodeVerifyUnavailable: 캐시 장애 (IGNORE_EXCEPTIONS 설정으로 예외 대신 None 이 반환됨)
+        """
+        added = cache.add(key, data, timeout=self.get_timeout())
+        if added is None:
+            raise PasscodeVerifyUnavailable()
+
+        return added
+
+    def request(self, user, requester_phone_number, requester_device_uuid, passcode):
+        key = self.get_key(user.id)
+        data = dict(
+            requester_phone_number=str(requester_phone_number),
+            requester_device_uuid=requester_device_uuid,
+            passcode=str(passcode),
+            expire_at=UserPasscodeVerify.get_expire_at(),
+        )
+
+        if not self.add(key, data):
+            # 중복 인증
+            pending_data = cache.get(key)
+            if pending_data is not None:
+                return self.to_instance(user, pending_data, UserPasscodeVerify.Status.pending), False
+
+            # 조회 사이에 만료된 경우 한 번 더 시도
+            if not self.add(key, data):
+                return self.to_instance(user, data, UserPasscodeVerify.Status.pending), False
+
+        run_in_background(self.save_audit, self.to_instance(user, data, UserPasscodeVerify.Status.pending))
+
+        return self.to_instance(user, data, UserPasscodeVerify.Status.pending), True
+
+    def verify(self, user, passcode):
+        key = self.get_key(user.id)
+
+        data = cache.get(key)
+        if data is None:
+            return None, False
+
+        if data['passcode'] != str(passcode):
+            return self.to_instance(user, data, UserPasscodeVerify.Status.pending), False
+
+        # 동시에 같은 패스코드로 검증하는 경우 먼저 삭제한 요청만 성공
+        if not cache.delete(key):
+            return None, False
+
+        passcode_verify = self.to_instance(user, data, UserPasscodeVerify.Status.verified)
+        run_in_background(self.update_audit_status, passcode_verify)
+
+        return passcode_verify, True
+
+    def expire(self, passcode_verify):
+        key = self.get_key(passcode_verify.user_id)
+
+        # 같은 회원의 이후 인증 요청은 남겨두도록 만료 시간이 같은 경우에만 삭제
+        data = cache.get(key)
+        if data is not None and data['expire_at'] == passcode_verify.expire_at:
+            cache.delete(key)
+
+        passcode_verify.status = UserPasscodeVerify.Status.expire
+        run_in_background(self.update_audit_status, passcode_verify)
+
+    # noinspection PyMethodMayBeStatic
+    def save_audit(self, passcode_verify: UserPasscodeVerify) -> None:
+        passcode_verify.save()
+
+    # noinspection PyMethodMayBeStatic
+    def update_audit_status(self, passcode_verify: UserPasscodeVerify) -> None:
+        UserPasscodeVerify.objects \
+            .filter(
+                user_id=passcode_verify.user_id,
+                expire_at=passcode_verify.expire_at,
+                status=UserPasscodeVerify.Status.pending,
+            ) \
+            .update(
+                status=passcode_verify.status,
+                modified=timezone.now(),
+            )
+
+
+def get_passcode_backend() -> BasePasscodeBackend:
+    return import_string(settings.PASSCODE_BACKEND)()
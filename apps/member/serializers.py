@@ -1,10 +1,7 @@
-from datetime import timedelta
 
 import jwt
 import re
 import random
-import uuid
-from http import HTTPStatus
 
 from drf_spectacular.utils import extend_schema_serializer, OpenApiExample
 from rest_auth.utils import jwt_encode
@@ -13,7 +10,6 @@ from rest_framework.response import Response
 from rest_framework_jwt.utils import jwt_decode_handler
 
 from django.db import transaction
-from django.db import IntegrityError
 from django.utils.translation import gettext_lazy as _
 
 from rest_auth.serializers import JWTSerializer as BaseJWTSerializer
@@ -22,14 +18,13 @@ from rest_framework import serializers, fields
 from phonenumber_field.serializerfields import PhoneNumberField
 from phonenumber_field.phonenumber import PhoneNumber
 
-from apps.member.models import SocialImageCollection, User, UserProfile, UserPasscodeVerify, \
+from apps.member.models import SMSMessage, SocialImageCollection, User, UserProfile, UserPasscodeVerify, \
     UserToken, UserSocial
-from apps.resume.models import Career
-from utils.django.rest_framework.serializers import SimpleSerializer, ModelSerializer
-from utils.naver.api import NaverCloudAPI
+from apps.member.importers import guess_format, iter_user_rows
+from apps.member.passcodes import get_passcode_backend
+from utils.django.rest_framework.serializers import CompiledRepresentationMixin, SimpleSerializer, ModelSerializer
 
 from apps.member.exceptions import (
-    SMSSendError,
     PasscodeVerifyPending,
     PasscodeVerifyInvalidPasscode,
     PasscodeVerifyDoesNotExist,
@@ -47,7 +42,7 @@ class JWTSerializer(BaseJWTSerializer):
         return getattr(obj.get("user", None), "is_registration", False)
 
 
-class UserSerializer(ModelSerializer):
+class UserSerializer(CompiledRepresentationMixin, ModelSerializer):
     class NestedProfileSerializer(ModelSerializer):
         profile_image = serializers.ImageField(use_url=True)
 
@@ -60,7 +55,7 @@ class UserSerializer(ModelSerializer):
             )
             read_only_fields = fields
 
-    class NestedUserInstagramSocialSerializer(ModelSerializer):
+    class NestedUserInstagramSocialSerializer(CompiledRepresentationMixin, ModelSerializer):
         class Meta:
             model = UserSocial
             fields = (
@@ -94,22 +89,25 @@ class UserSerializer(ModelSerializer):
 
     # noinspection PyMethodMayBeStatic
     def get_career(self, obj):
-        resume = obj.resume
-        careers = resume.career_set.all()
+        return obj.resume.get_career_summary()
 
-        position_list = Career.Position.choices
 
-        career_summary = list()
+class UserBulkProvisionSerializer(SimpleSerializer):
+    # Write Only
+    file = serializers.FileField(label=_("회원 목록 파일 (CSV / JSONL)"), write_only=True)
 
-        for career in careers:
-            duration = career.quit_at - career.join_at
+    # Read Only
+    created = fields.IntegerField(label=_("생성된 회원 수"), read_only=True)
+    skipped = fields.IntegerField(label=_("이미 존재하는 회원 수"), read_only=True)
+    invalid = fields.IntegerField(label=_("유효하지 않은 회원 수"), read_only=True)
 
-            if  duration <= timedelta(30):
-                continue
+    # Both
 
-            career_summary.append(dict(position=career.position, duration=duration.days))
+    def create(self, validated_data):
+        file = validated_data['file']
 
-        return career_summary
+        # 업로드된 파일을 한 줄씩 읽어 batch 단위로 생성
+        return User.objects.bulk_provision(iter_user_rows(file, guess_format(file.name)))
 
 
 class UserListSerializer(ModelSerializer):
@@ -138,6 +136,10 @@ class UserListSerializer(ModelSerializer):
 
     social = NestedUserInstagramSocialSerializer(source='social_set', many=True)
 
+    @classmethod
+    def process_queryset(cls, queryset):
+        return queryset.select_related("profile", "resume").prefetch_related("social_set")
+
 
 class UserPasscodeVerifyRequestSerializer(SimpleSerializer):
     class NestedUserPasscodeVerifySerializer(ModelSerializer):
@@ -168,77 +170,60 @@ class UserPasscodeVerifyRequestSerializer(SimpleSerializer):
         """
         return random.randint(100000, 999999)
 
-    def send_passcode_by_sms(self, phone_number: PhoneNumber):
+    # noinspection PyMethodMayBeStatic
+    def send_passcode_by_sms(self, phone_number: PhoneNumber, passcode_verify: UserPasscodeVerify) -> SMSMessage:
         """
+        패스코드 SMS 를 발송 큐에 저장
+
         Args:
             phone_number: 패스코드를 발송할 전화번호
+            passcode_verify: 발송할 패스코드 인증 요청
 
         Returns:
-            response: Naver API 응답
+            sms_message: 발송 대기중인 SMS
         """
-        passcode = self.passcode_generate()
-        message = f"[OZET] 인증번호: {passcode}\n인증번호를 입력해 주세요."
-
-        res = NaverCloudAPI.send_sms(phone_number, None, message)
-        if res.status_code != HTTPStatus.ACCEPTED:
-            raise SMSSendError()
-
-        return passcode
+        message = f"[OZET] 인증번호: {passcode_verify.passcode}\n인증번호를 입력해 주세요."
+
+        return SMSMessage.enqueue(
+            phone_number,
+            message,
+            expire_at=passcode_verify.expire_at,
+            # 캐시 저장소를 사용하는 경우 인증 요청이 아직 저장되지 않았을 수 있음
+            passcode_verify=passcode_verify if passcode_verify.pk else None,
+            passcode_user=None if passcode_verify.pk else passcode_verify.user,
+        )
 
     def validate(self, data):
         return data
 
     def create(self, validated_data):
         requester_phone_number = validated_data["phone_number"]
-        user = None
 
-        # 회원 검증
+        # 회원 검증 (없을 경우 Pre-SignUp)
         try:
-            user = User.objects.get(phone_number=requester_phone_number)
+            user, created = User.objects.get_or_create_by_phone_number(requester_phone_number)
         except User.DoesNotExist:
-            try:
-                with transaction.atomic():
-                    # Pre-SignUp
-                    username = f"ozet_{str(uuid.uuid4()).replace('-', '')}"
-                    user = User.objects.create(
-                        username=username,
-                        email=None,
-                        phone_number=requester_phone_number,
-                        name=None,
-                    )
-
-            except IntegrityError as e:
-                message = str(e)
-                # 삭제 계정 복구
-                # @TODO: 이미 탈퇴한 회원이 전화번호를 바꾸고 새로운 사람이 가입할 경우에 대한 처리가 필요함
-                if 'Duplicate' in message and 'member_user_phone_number' in message:
-                    user, _ = User.objects.update_or_create(phone_number=requester_phone_number)
-
-        if not user:
-            raise UserSignUpError()
-
-        user_token = user.get_valid_token(UserToken.Type.access, auto_generate=True)
-        if not user_token or not user.is_valid_token(user_token.token):
             raise UserSignUpError()
 
-        # 기존 인증 만료 여부
-        if UserPasscodeVerify.is_expired(user):
-            pass
-
-        # 중복 인증
-        if UserPasscodeVerify.is_pending(user):
+        # 신규 회원은 가입 트랜잭션에서 접근 토큰이 함께 발급됨
+        if not created:
+            user_token = user.get_valid_token(UserToken.Type.access, auto_generate=True)
+            if not user_token or not user.is_valid_token(user_token.token):
+                raise UserSignUpError()
+
+        # 기존 인증 만료 처리 / 중복 인증 확인 / 인증 요청 생성을 하나의 트랜잭션으로 처리
+        passcode_backend = get_passcode_backend()
+        passcode_verify_request, created = passcode_backend.request(
+            user,
+            requester_phone_number=requester_phone_number,
+            requester_device_uuid=user.username,
+            passcode=self.passcode_generate(),
+        )
+        if not created:
             raise PasscodeVerifyPending()
 
-        sent_passcode = self.send_passcode_by_sms(requester_phone_number)
-
-        with transaction.atomic():
-            passcode_verify_request = UserPasscodeVerify.objects.create(
-                requester_phone_number=requester_phone_number,
-                requester_device_uuid=user.username,
-                user=user,
-                passcode=sent_passcode,
-                expire_at=UserPasscodeVerify.get_expire_at(),
-            )
+        # 발송은 run_sms_worker 작업자가 처리하고, 최종 실패시 인증 요청을 만료 처리
+        self.send_passcode_by_sms(requester_phone_number, passcode_verify_request)
 
         return dict(requested_verify=self.NestedUserPasscodeVerifySerializer(passcode_verify_request).data)
 
@@ -275,17 +260,17 @@ class UserPasscodeVerifySerializer(SimpleSerializer):
 
         user = User.objects.get(phone_number=requester_phone_number)
 
-        # 기존 인증 만료 여부
-        if UserPasscodeVerify.is_expired(user):
-            raise PasscodeVerifyExpired()
+        passcode_verify, verified = get_passcode_backend().verify(user, passcode)
+        if not verified:
+            # 기존 인증 만료 여부
+            if not passcode_verify or passcode_verify.status == UserPasscodeVerify.Status.expire:
+                raise PasscodeVerifyExpired()
 
-        # 유효 인증 존재 여부
-        if not UserPasscodeVerify.is_pending(user):
-            raise PasscodeVerifyDoesNotExist()
+            # 유효 인증 존재 여부
+            if passcode_verify.status != UserPasscodeVerify.Status.pending:
+                raise PasscodeVerifyDoesNotExist()
 
-        with transaction.atomic():
-            if not UserPasscodeVerify.verify(user, passcode, is_transaction=False):
-                raise PasscodeVerifyInvalidPasscode()
+            raise PasscodeVerifyInvalidPasscode()
 
         return dict(user=user, token=user.get_valid_token(UserToken.Type.access, auto_generate=True).token)
 
@@ -378,22 +363,7 @@ class UserMeSerializer(ModelSerializer):
 
     # noinspection PyMethodMayBeStatic
     def get_career(self, obj):
-        resume = obj.resume
-        careers = resume.career_set.all()
-
-        position_list = Career.Position.choices
-
-        career_summary = list()
-
-        for career in careers:
-            duration = career.quit_at - career.join_at
-
-            if  duration <= timedelta(30):
-                continue
-
-            career_summary.append(dict(position=career.position, duration=duration.days))
-
-        return career_summary
+        return obj.resume.get_career_summary()
 
     # noinspection PyMethodMayBeStatic
     def validate_name(self, value):
@@ -608,9 +578,14 @@ class UserTokenLoginSerializer(SimpleSerializer):
         if not user:
             raise NotFound()
 
+        valid_tokens = user.get_valid_tokens(
+            [UserToken.Type.access, UserToken.Type.refresh],
+            auto_generate=True,
+        )
+
         data['user'] = user
-        data['access_token'] = user.get_valid_token(UserToken.Type.access, auto_generate=True).token
-        data['refresh_token'] = user.get_valid_token(UserToken.Type.refresh, auto_generate=True).token
+        data['access_token'] = valid_tokens[UserToken.Type.access].token
+        data['refresh_token'] = valid_tokens[UserToken.Type.refresh].token
 
         return data
 
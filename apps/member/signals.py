@@ -0,0 +1,39 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.member.caches import UserCache, UserTokenCache
+from apps.member.models import User, UserProfile, UserSocial, UserToken
+
+
+@receiver(post_save, sender=UserToken)
+def evict_expired_user_token(sender, instance: UserToken, **kwargs):
+    if instance.status == UserToken.Status.expire:
+        UserTokenCache.delete_many([instance.token])
+
+
+@receiver(post_delete, sender=UserToken)
+def evict_deleted_user_token(sender, instance: UserToken, **kwargs):
+    UserTokenCache.delete_many([instance.token])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance: User, **kwargs):
+    # soft delete 역시 save 를 통해 처리되므로 post_save 에서 함께 무효화됨
+    # 삭제 이후에는 instance.id 가 None 이 되므로 미리 저장
+    user_id = instance.id
+    # 커밋 전에 버전이 올라가면 커밋 전의 데이터가 새 버전으로 캐시될 수 있음
+    transaction.on_commit(lambda: UserCache.bump_version(user_id))
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_user_profile_cache(sender, instance: UserProfile, **kwargs):
+    transaction.on_commit(lambda: UserCache.bump_version(instance.user_id))
+
+
+@receiver(post_save, sender=UserSocial)
+@receiver(post_delete, sender=UserSocial)
+def invalidate_user_social_cache(sender, instance: UserSocial, **kwargs):
+    transaction.on_commit(lambda: UserCache.bump_version(instance.user_id))
@@ -0,0 +1,37 @@
+from phonenumber_field.phonenumber import to_python
+
+from utils.django.rest_framework.throttles import SlidingWindowRateThrottle
+
+
+class PasscodePhoneNumberRateThrottle(SlidingWindowRateThrottle):
+    """
+    전화번호(E.164)별 패스코드 요청 제한
+    """
+    scope = 'passcode_phone_number'
+
+    def get_cache_key(self, request, view):
+        phone_number = to_python(request.data.get('phone_number'))
+        if not phone_number or not phone_number.is_valid():
+            # 유효하지 않은 번호는 serializer 검증에서 거부됨
+            return None
+
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': phone_number.as_e164,
+        }
+
+
+class PasscodeClientIPRateThrottle(SlidingWindowRateThrottle):
+    """
+    클라이언트 IP 별 패스코드 요청 제한
+
+    Notes:
+        ClientIPContextMixin 이 할당한 request.client_ip 를 사용합니다.
+    """
+    scope = 'passcode_client_ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': getattr(request, 'client_ip', None) or self.get_ident(request),
+        }
@@ -15,11 +15,21 @@ urlpatterns = [
         views.UserPasscodeVerifyView.as_view(),
         name=views.UserPasscodeVerifyView.__name__,
     ),
+    path(
+        "auth/passcode/throttle/stats/",
+        views.PasscodeThrottleStatsView.as_view(),
+        name=views.PasscodeThrottleStatsView.__name__,
+    ),
     path(
         "user/me/",
         views.UserMeView.as_view(),
         name=views.UserMeView.__name__,
     ),
+    path(
+        "user/bulk/",
+        views.UserBulkProvisionView.as_view(),
+        name=views.UserBulkProvisionView.__name__,
+    ),
     path(
         "user/<int:user_id>/",
         views.UserDetailView.as_view(),
@@ -7,19 +7,26 @@ from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schem
 from rest_framework.exceptions import NotFound
 from rest_framework.generics import (CreateAPIView, ListAPIView, RetrieveAPIView,
                                      RetrieveUpdateDestroyAPIView)
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.member import serializers
+from apps.member.caches import UserResponseCache
 from apps.member.models import SocialImageCollection, User, UserSocial, UserSocialToken
+from apps.member.throttles import PasscodeClientIPRateThrottle, PasscodePhoneNumberRateThrottle
 from commons.contrib.drf_spectacular import tags as api_tags
-from utils.django.rest_framework.mixins import QuerySerializerMixin, UserContextMixin
+from commons.contrib.rest_framework.pagination import CursorPagination
+from utils.django.rest_framework.mixins import (ClientIPContextMixin, QuerySerializerMixin, UserContextMixin,
+                                                VersionedResponseCacheMixin)
 from utils.instagram.api import InstagramAPI
 
 
-class UserPasscodeVerifyRequestView(CreateAPIView):
+class UserPasscodeVerifyRequestView(ClientIPContextMixin, CreateAPIView):
     permission_classes = (AllowAny,)
     serializer_class = serializers.UserPasscodeVerifyRequestSerializer
+    # DB 조회 / SMS 발송 전에 전화번호 및 IP 별 요청 수를 제한
+    throttle_classes = (PasscodePhoneNumberRateThrottle, PasscodeClientIPRateThrottle)
 
     @extend_schema(
             tags=[api_tags.PASSCODE],
@@ -139,14 +146,18 @@ class UserPasscodeVerifyPassView(QuerySerializerMixin, CreateAPIView):
         return super(UserPasscodeVerifyPassView, self).post(request, *args, **kwargs)
 
 
-class UserDetailView(UserContextMixin, RetrieveAPIView):
+class UserDetailView(VersionedResponseCacheMixin, UserContextMixin, RetrieveAPIView):
     permission_classes = (AllowAny,)
     serializer_class = serializers.UserSerializer
+    response_cache_class = UserResponseCache
 
     queryset = User.objects
     lookup_field = 'id'
     lookup_url_kwarg = 'user_id'
 
+    def get_response_cache_owner_id(self):
+        return self.kwargs['user_id']
+
     @extend_schema(
             tags=[api_tags.USER],
             summary="회원 정보 가져오기 API @AllowAny",
@@ -157,11 +168,43 @@ class UserDetailView(UserContextMixin, RetrieveAPIView):
         return super(UserDetailView, self).get(request, *args, **kwargs)
 
 
+class PasscodeThrottleStatsView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+            tags=[api_tags.PASSCODE],
+            summary="패스코드 요청 제한 통계 API @IsAdminUser",
+            description="패스코드 요청 제한의 허용 / 거부 횟수 API 입니다. (모니터링 용도)",
+            responses={200: dict},
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({
+            throttle_class.scope: throttle_class.get_stats()
+            for throttle_class in UserPasscodeVerifyRequestView.throttle_classes
+        })
+
+
+class UserBulkProvisionView(CreateAPIView):
+    permission_classes = (IsAdminUser,)
+    serializer_class = serializers.UserBulkProvisionSerializer
+
+    @extend_schema(
+            tags=[api_tags.USER],
+            summary="회원 일괄 생성 API @IsAdminUser",
+            description="CSV / JSONL 파일(phone_number, username, name, email)로 회원을 일괄 생성하는 API 입니다.",
+            responses=serializers.UserBulkProvisionSerializer,
+            request=serializers.UserBulkProvisionSerializer,
+    )
+    def post(self, request, *args, **kwargs):
+        return super(UserBulkProvisionView, self).post(request, *args, **kwargs)
+
+
 class UserListView(UserContextMixin, ListAPIView):
     permission_classes = (AllowAny,)
     serializer_class = serializers.UserListSerializer
+    pagination_class = CursorPagination
 
-    queryset = User.objects.all()
+    queryset = serializers.UserListSerializer.process_queryset(User.objects.all())
 
     @extend_schema(
             tags=[api_tags.DEBUG],
@@ -208,7 +251,8 @@ class UserMeView(UserContextMixin, RetrieveUpdateDestroyAPIView):
                         "career": [
                             {
                                 "position": "STAFF",
-                                "duration": 120
+                                "duration": 120,
+                                "isWorking": False
                             }
                         ],
                         "isRegistration": True,
@@ -252,7 +296,8 @@ class UserMeView(UserContextMixin, RetrieveUpdateDestroyAPIView):
                         "career": [
                             {
                                 "position": "STAFF",
-                                "duration": 120
+                                "duration": 120,
+                                "isWorking": False
                             }
                         ],
                         "isRegistration": True,
@@ -287,7 +332,8 @@ class UserMeView(UserContextMixin, RetrieveUpdateDestroyAPIView):
                         "career": [
                             {
                                 "position": "STAFF",
-                                "duration": 120
+                                "duration": 120,
+                                "isWorking": False
                             }
                         ],
                         "isRegistration": True,
@@ -0,0 +1,268 @@
+import logging
+import time
+from collections import defaultdict, deque
+from datetime import timedelta
+from http import HTTPStatus
+from typing import List, Optional
+
+import requests
+from django.db import close_old_connections
+from django.db.models import Min, QuerySet
+from django.utils import timezone
+
+from apps.member.models import SMSMessage, UserPasscodeVerify
+from apps.member.passcodes import CachePasscodeBackend
+from utils.django.workers import QueueWorker
+from utils.naver.api import (
+    SMS_MAX_RECIPIENTS,
+    NaverCloudAPI,
+    SMSRecipient,
+    is_request_not_sent,
+    normalize_phone_number,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SMSWorker(QueueWorker):
+    """
+    SMSMessage 발송 작업자
+
+    Notes:
+        가져온 메세지를 SMS_MAX_RECIPIENTS 건씩 묶어 한 번의 API 요청으로 발송합니다.
+        접수 여부와 requestId 는 요청 단위로 기록하고, 수신자별 발송 결과는 SMSDeliveryWorker 가 조회합니다.
+        요청이 전송된 이후의 실패(응답 시간 초과 / 5xx)는 접수 여부를 알 수 없으므로 중복 발송되지 않도록 재시도하지 않습니다.
+        잘못된 메세지가 포함된 요청(400)은 나누어 다시 발송하여 해당 메세지만 실패 처리합니다.
+    """
+    model = SMSMessage
+    batch_size = SMS_MAX_RECIPIENTS
+
+    def process(self, tasks: List[SMSMessage]) -> None:
+        now = timezone.now()
+
+        sms_messages = []
+        for sms_message in tasks:
+            # 패스코드처럼 유효 시간이 있는 메세지는 만료된 이후 발송하지 않음
+            if sms_message.expire_at and sms_message.expire_at <= now:
+                self.fail(sms_message, 'expired before delivery', retry=False)
+                continue
+
+            try:
+                normalize_phone_number(sms_message.phone_number)
+            except ValueError:
+                self.fail(sms_message, 'invalid phone number', retry=False)
+                continue
+
+            sms_messages.append(sms_message)
+
+        for i in range(0, len(sms_messages), SMS_MAX_RECIPIENTS):
+            self.send(sms_messages[i:i + SMS_MAX_RECIPIENTS])
+
+    def send(self, sms_messages: List[SMSMessage]) -> None:
+        recipients = [
+            SMSRecipient(
+                phone_number=sms_message.phone_number,
+                subject=sms_message.subject,
+                message=sms_message.content,
+            )
+            for sms_message in sms_messages
+        ]
+
+        try:
+            res = NaverCloudAPI.send_sms_bulk(recipients)
+        except requests.RequestException as e:
+            if is_request_not_sent(e):
+                self.fail_many(sms_messages, repr(e))
+            else:
+                self.fail_many(sms_messages, f'delivery unknown: {e!r}', retry=False)
+            return
+
+        # 접수 결과는 요청 단위로 반환되므로 같은 요청에 포함된 수신자에게 동일하게 반영
+        error = f'{res.status_code}: {res.text}'
+
+        if res.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            self.fail_many(sms_messages, f'delivery unknown: {error}', retry=False)
+            return
+
+        if res.status_code == HTTPStatus.BAD_REQUEST:
+            if len(sms_messages) == 1:
+                self.fail(sms_messages[0], error, retry=False)
+                return
+
+            half = len(sms_messages) // 2
+            self.send(sms_messages[:half])
+            self.send(sms_messages[half:])
+            return
+
+        if res.status_code != HTTPStatus.ACCEPTED:
+            self.fail_many(sms_messages, error)
+            return
+
+        self.succeed_many(
+            sms_messages,
+            sent_at=timezone.now(),
+            request_id=res.json().get('requestId'),
+            delivery_status=SMSMessage.DeliveryStatus.pending,
+        )
+
+    def fail_many(self, sms_messages: List[SMSMessage], error: str, retry=True) -> None:
+        for sms_message in sms_messages:
+            self.fail(sms_message, error, retry=retry)
+
+    def on_failed(self, task: SMSMessage) -> None:
+        expire_sms_passcode(task)
+
+
+class SMSDeliveryWorker(object):
+    """
+    접수된 SMSMessage 의 수신자별 발송 결과 조회 작업자
+
+    Notes:
+        SENS 는 요청 단위로 접수하므로 requestId 로 수신자별 messageId 를 조회한 뒤 messageId 별로 결과를 조회합니다.
+        같은 요청에 같은 번호가 여러 번 포함된 경우 messageId 는 요청에 포함된 순서대로 대응합니다.
+        결과가 확정되지 않았거나(READY / PROCESSING) 조회에 실패한 메세지는 다음 조회에서 다시 확인하며,
+        check_timeout 이 지나도록 확정되지 않으면 unknown 으로 남깁니다.
+        요청은 마지막으로 조회한 시간(modified) 순서로 조회하며, 잠금 없이 조회하므로 하나의 프로세스로만 실행합니다.
+    """
+    batch_size = 20
+    check_delay = timedelta(seconds=10)
+    check_timeout = timedelta(days=1)
+    poll_interval = 10.0
+
+    def __init__(self, batch_size: Optional[int] = None):
+        if batch_size:
+            self.batch_size = batch_size
+
+    def get_queryset(self) -> QuerySet:
+        return SMSMessage.objects.filter(delivery_status=SMSMessage.DeliveryStatus.pending)
+
+    def run_once(self) -> int:
+        """
+        마지막 조회 이후 check_delay 가 지난 요청을 오래된 순서로 batch_size 건 조회
+
+        Returns:
+            조회한 요청 수
+        """
+        now = timezone.now()
+
+        # 조회할 때마다 modified 를 갱신하여 결과가 늦게 확정되는 요청이 다른 요청의 조회를 막지 않도록 함
+        request_ids = list(
+            self.get_queryset()
+            .filter(modified__lte=now - self.check_delay)
+            .values('request_id')
+            .annotate(checked_at=Min('modified'))
+            .order_by('checked_at')
+            .values_list('request_id', flat=True)[:self.batch_size]
+        )
+        for request_id in request_ids:
+            sms_messages = list(self.get_queryset().filter(request_id=request_id).order_by('id'))
+            try:
+                self.check(request_id, sms_messages)
+            except requests.RequestException:
+                logger.exception('Failed to check SMS delivery (request_id=%s)', request_id)
+
+            pending_sms_messages = [
+                sms_message for sms_message in sms_messages
+                if sms_message.delivery_status == SMSMessage.DeliveryStatus.pending
+            ]
+            SMSMessage.objects \
+                .filter(id__in=[sms_message.id for sms_message in pending_sms_messages]) \
+                .update(modified=timezone.now())
+            self.expire([
+                sms_message for sms_message in pending_sms_messages
+                if sms_message.sent_at <= now - self.check_timeout
+            ])
+
+        return len(request_ids)
+
+    def check(self, request_id: Optional[str], sms_messages: List[SMSMessage]) -> None:
+        if request_id and any(sms_message.message_id is None for sms_message in sms_messages):
+            self.map_message_ids(request_id, sms_messages)
+
+        for sms_message in sms_messages:
+            if sms_message.message_id is None:
+                continue
+
+            res = NaverCloudAPI.get_sms_result(sms_message.message_id)
+            if res.status_code != HTTPStatus.OK:
+                logger.warning('Failed to get SMS result (message_id=%s): %s', sms_message.message_id, res.text)
+                continue
+
+            results = res.json().get('messages') or [{}]
+            result = results[0]
+            if result.get('status') != 'COMPLETED':
+                continue
+
+            if result.get('statusName') == 'success':
+                sms_message.delivery_status = SMSMessage.DeliveryStatus.delivered
+                sms_message.save(update_fields=['delivery_status', 'modified'])
+            else:
+                sms_message.delivery_status = SMSMessage.DeliveryStatus.failed
+                sms_message.last_error = f"{result.get('statusCode')}: {result.get('statusMessage')}"
+                sms_message.save(update_fields=['delivery_status', 'last_error', 'modified'])
+                expire_sms_passcode(sms_message)
+
+    def map_message_ids(self, request_id: str, sms_messages: List[SMSMessage]) -> None:
+        res = NaverCloudAPI.get_sms_request(request_id)
+        if res.status_code != HTTPStatus.OK:
+            logger.warning('Failed to get SMS request (request_id=%s): %s', request_id, res.text)
+            return
+
+        message_ids = defaultdict(deque)
+        for item in res.json().get('messages', []):
+            message_ids[item.get('to')].append(item.get('messageId'))
+
+        mapped_sms_messages = []
+        for sms_message in sms_messages:
+            phone_number_message_ids = message_ids[normalize_phone_number(sms_message.phone_number)]
+            if sms_message.message_id is None and phone_number_message_ids:
+                sms_message.message_id = phone_number_message_ids.popleft()
+                mapped_sms_messages.append(sms_message)
+
+        SMSMessage.objects.bulk_update(mapped_sms_messages, ['message_id'])
+
+    def expire(self, sms_messages: List[SMSMessage]) -> None:
+        if not sms_messages:
+            return
+
+        SMSMessage.objects \
+            .filter(id__in=[sms_message.id for sms_message in sms_messages]) \
+            .update(
+                delivery_status=SMSMessage.DeliveryStatus.unknown,
+                modified=timezone.now(),
+            )
+
+        for sms_message in sms_messages:
+            sms_message.delivery_status = SMSMessage.DeliveryStatus.unknown
+
+    def run(self, stop_when_empty=False) -> None:
+        while True:
+            close_old_connections()
+            checked_count = self.run_once()
+
+            if not checked_count:
+                if stop_when_empty:
+                    break
+                time.sleep(self.poll_interval)
+
+
+def expire_sms_passcode(sms_message: SMSMessage) -> None:
+    """
+    발송에 실패한 패스코드 인증 요청을 만료 처리하여 바로 다시 요청할 수 있도록 함
+    """
+    if sms_message.passcode_verify_id:
+        UserPasscodeVerify.objects \
+            .filter(
+                id=sms_message.passcode_verify_id,
+                status=UserPasscodeVerify.Status.pending,
+            ) \
+            .update(
+                status=UserPasscodeVerify.Status.expire,
+                modified=timezone.now(),
+            )
+    elif sms_message.passcode_user_id:
+        CachePasscodeBackend().expire(UserPasscodeVerify(
+            user_id=sms_message.passcode_user_id,
+            expire_at=sms_message.expire_at,
+            status=UserPasscodeVerify.Status.pending,
+        ))
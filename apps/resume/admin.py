@@ -1,3 +1,5 @@
 from django.contrib import admin
+from apps.resume.models import ResumePDFJob
 
 # Register your models here.
+admin.site.register(ResumePDFJob)
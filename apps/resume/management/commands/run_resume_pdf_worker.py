@@ -0,0 +1,59 @@
+import threading
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import connections
+
+from apps.resume.pdf import get_resume_pdf_pool
+from apps.resume.workers import ResumePDFWorker
+
+
+class Command(BaseCommand):
+    """
+    Notes:
+        wkhtmltopdf 는 별도 프로세스로 실행되므로, 하나의 프로세스에서 여러 작업자 스레드로 동시에 변환합니다.
+        각 스레드는 자신의 DB 연결을 사용하고, wkhtmltopdf 프로세스 풀은 함께 사용합니다.
+    """
+    help = '대기중인 이력서 PDF 변환 작업을 처리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='동시에 변환할 작업자 수',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기중인 작업이 없으면 종료',
+        )
+
+    def handle(self, *args, **options):
+        pool = get_resume_pdf_pool()
+        pool.warm_up(min(options['concurrency'], settings.RESUME_PDF_POOL_SIZE))
+        try:
+            self.run_workers(options['concurrency'], options['once'])
+        finally:
+            pool.close()
+
+    def run_workers(self, concurrency: int, stop_when_empty: bool) -> None:
+        if concurrency <= 1:
+            ResumePDFWorker().run(stop_when_empty=stop_when_empty)
+            return
+
+        threads = [
+            threading.Thread(target=self.run_worker, args=(stop_when_empty,), daemon=True)
+            for _ in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    @staticmethod
+    def run_worker(stop_when_empty: bool) -> None:
+        try:
+            ResumePDFWorker().run(stop_when_empty=stop_when_empty)
+        finally:
+            connections.close_all()
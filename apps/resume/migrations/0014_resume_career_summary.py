@@ -0,0 +1,53 @@
+# Generated by Django 3.2.6 on 2026-10-18 20:58
+
+from itertools import groupby
+
+from django.db import migrations, models
+
+
+def fill_career_summary(apps, schema_editor):
+    Resume = apps.get_model('resume', 'Resume')
+    Career = apps.get_model('resume', 'Career')
+
+    batch_size = 1000
+    resumes = []
+
+    careers = Career.objects \
+        .only('id', 'resume_id', 'position', 'join_at', 'quit_at') \
+        .order_by('resume_id', '-join_at') \
+        .iterator(chunk_size=batch_size)
+    for resume_id, resume_careers in groupby(careers, key=lambda career: career.resume_id):
+        career_summary = [
+            dict(
+                id=career.id,
+                position=career.position,
+                join_at=career.join_at.isoformat(),
+                duration=(career.quit_at - career.join_at).days if career.quit_at else None,
+                is_working=not career.quit_at,
+            )
+            for career in resume_careers
+        ]
+        resumes.append(Resume(id=resume_id, career_summary=career_summary))
+
+        if len(resumes) >= batch_size:
+            Resume.objects.bulk_update(resumes, ['career_summary'])
+            resumes = []
+
+    if resumes:
+        Resume.objects.bulk_update(resumes, ['career_summary'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0013_auto_20220417_1748'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='career_summary',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='경력 요약'),
+        ),
+        migrations.RunPython(fill_career_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 3.2.6 on 2026-10-18 21:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0014_resume_career_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumePDFJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('status', models.CharField(choices=[('queued', '대기중'), ('processing', '처리중'), ('done', '완료됨'), ('failed', '실패함')], default='queued', max_length=20, verbose_name='처리 상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='다음 시도 시간')),
+                ('last_error', models.TextField(blank=True, default=None, null=True, verbose_name='마지막 에러')),
+                ('html', models.TextField(verbose_name='PDF HTML')),
+                ('pdf_file', models.FileField(blank=True, default=None, editable=False, null=True, upload_to='', verbose_name='PDF 파일')),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pdf_job_set', to='resume.resume', verbose_name='이력서')),
+            ],
+            options={
+                'verbose_name': '이력서 PDF 변환',
+                'verbose_name_plural': '이력서 PDF 변환 목록',
+                'db_table': 'member_user_resume_pdf_job',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='resumepdfjob',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='member_user_status_c65410_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.6 on 2026-10-18 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0015_resumepdfjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='pdf_digest',
+            field=models.CharField(blank=True, default=None, editable=False, max_length=64, null=True, verbose_name='PDF 변환 입력 digest'),
+        ),
+        migrations.AddField(
+            model_name='resumepdfjob',
+            name='digest',
+            field=models.CharField(blank=True, db_index=True, default=None, max_length=64, null=True, verbose_name='변환 입력 digest'),
+        ),
+    ]
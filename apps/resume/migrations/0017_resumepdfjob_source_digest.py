@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0016_pdf_digest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumepdfjob',
+            name='source_digest',
+            field=models.CharField(blank=True, default=None, max_length=64, null=True, verbose_name='이력서 데이터 digest'),
+        ),
+    ]
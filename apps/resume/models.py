@@ -1,19 +1,22 @@
-from typing import Union
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Union
+from datetime import date, datetime, timedelta
 from random import randint
 
 from djchoices import DjangoChoices, ChoiceItem
 from model_utils.fields import AutoCreatedField
 from phonenumber_field.modelfields import PhoneNumberField
 
+from django.conf import settings
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.db import models, transaction
 from rest_auth.utils import jwt_encode
 
+from apps.member.caches import UserCache
 from apps.resume import storages
-from utils.django.models import SafeDeleteModel, TimeStampedModel
+from apps.resume.pdf import get_resume_pdf_digest
+from utils.django.models import QueuedTaskModel, SafeDeleteModel, TimeStampedModel
 
 
 class Resume(TimeStampedModel):
@@ -32,6 +35,22 @@ class Resume(TimeStampedModel):
         verbose_name=_('프로필 이미지 파일'),
     )
 
+    pdf_digest = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        verbose_name=_('PDF 변환 입력 digest'),
+    )
+
+    career_summary = models.JSONField(
+        null=False,
+        blank=True,
+        default=list,
+        editable=False,
+        verbose_name=_('경력 요약'),
+    )
 
     # Related
     user = models.OneToOneField(
@@ -51,18 +70,65 @@ class Resume(TimeStampedModel):
     def save(self, *args, **kwargs):
         if not self.id:
             rv = super(Resume, self).save(*args, **kwargs)
-            MilitaryService.objects.create(resume_id=self.id)
+            MilitaryService.objects.create(resume=self)
 
             return rv
 
-        old_instance = Resume.objects.filter(id=self.id).first()
-        if not old_instance:
-            return super(Resume, self).save(*args, **kwargs)
+        # 업데이트 (변경된 필드만 저장됨)
+        return super(Resume, self).save(*args, **kwargs)
 
-        # 업데이트
-        rv = super(Resume, self).save(*args, **kwargs)
+    @classmethod
+    def update_career_summary(cls, resume_id: int, career_id: int, summary: Optional[Dict] = None) -> None:
+        """
+        커리어 하나의 변경 사항을 경력 요약에 반영
 
-        return rv
+        Args:
+            resume_id: 이력서 id
+            career_id: 생성 / 수정 / 삭제된 커리어 id
+            summary: 커리어 요약 항목 (Career.to_summary), 삭제된 경우 None
+
+        Notes:
+            다른 커리어는 조회하지 않고 해당 커리어의 항목만 교체 / 제거합니다.
+            동시에 같은 이력서의 커리어가 변경되어도 요약이 유실되지 않도록 이력서 행을 잠급니다.
+        """
+        with transaction.atomic():
+            resume = cls.objects \
+                .select_for_update() \
+                .only('id', 'user_id', 'career_summary') \
+                .get(id=resume_id)
+
+            career_summary = [item for item in resume.career_summary if item['id'] != career_id]
+            if summary is not None:
+                career_summary.append(summary)
+            career_summary.sort(key=lambda item: item['join_at'], reverse=True)
+
+            resume.career_summary = career_summary
+            resume.save(update_fields=['career_summary'])
+
+            # 캐시된 회원은 이력서를 포함하므로 함께 무효화
+            transaction.on_commit(lambda: UserCache.bump_version(resume.user_id))
+
+    def get_career_summary(self, min_duration=30) -> List[Dict]:
+        """
+        경력 요약 (근무 기간이 min_duration 일 이하인 커리어 제외)
+
+        Notes:
+            재직중인 커리어의 근무 기간은 오늘 기준으로 계산합니다.
+        """
+        today = timezone.now().date()
+
+        career_summary = list()
+        for item in self.career_summary:
+            duration = item['duration']
+            if item['is_working']:
+                duration = (today - date.fromisoformat(item['join_at'])).days
+
+            if duration <= min_duration:
+                continue
+
+            career_summary.append(dict(position=item['position'], duration=duration, is_working=item['is_working']))
+
+        return career_summary
 
     def __str__(self):
         return self.__repr__()
@@ -134,6 +200,35 @@ class Career(TimeStampedModel):
     def is_working(self):
         return not self.quit_at
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            rv = super(Career, self).save(*args, **kwargs)
+            Resume.update_career_summary(self.resume_id, self.id, self.to_summary())
+
+        return rv
+
+    def delete(self, *args, **kwargs):
+        # 삭제 후에는 id 가 None 으로 초기화됨
+        career_id = self.id
+
+        with transaction.atomic():
+            rv = super(Career, self).delete(*args, **kwargs)
+            Resume.update_career_summary(self.resume_id, career_id)
+
+        return rv
+
+    def to_summary(self) -> Dict:
+        """
+        Resume.career_summary 에 저장되는 항목
+        """
+        return dict(
+            id=self.id,
+            position=self.position,
+            join_at=self.join_at.isoformat(),
+            duration=(self.quit_at - self.join_at).days if self.quit_at else None,
+            is_working=self.is_working,
+        )
+
     def __str__(self):
         return self.__repr__()
 
@@ -308,6 +403,172 @@ class MilitaryService(TimeStampedModel):
         return f'<{self._meta.verbose_name.title()}: {self.resume.user.name}>'
 
 
+class ResumePDFJob(QueuedTaskModel):
+    """
+    이력서 PDF 변환 작업
+
+    Notes:
+        요청 처리 중에는 저장만 하고, run_resume_pdf_worker 작업자가 변환 및 업로드를 처리합니다.
+        RESUME_PDF_QUEUE_EAGER 가 설정되어 있으면 커밋 이후 즉시 현재 프로세스에서 변환합니다. (테스트 용도)
+    """
+    html = models.TextField(
+        null=False,
+        blank=False,
+        verbose_name=_('PDF HTML'),
+    )
+
+    pdf_file = models.FileField(
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+        verbose_name=_('PDF 파일'),
+    )
+
+    digest = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        default=None,
+        db_index=True,
+        verbose_name=_('변환 입력 digest'),
+    )
+    source_digest = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_('이력서 데이터 digest'),
+    )
+
+    # Related
+    resume = models.ForeignKey(
+        Resume,
+        null=False,
+        blank=False,
+        on_delete=models.CASCADE,
+        related_name='pdf_job_set',
+        verbose_name=_('이력서'),
+    )
+
+    class Meta:
+        verbose_name = _('이력서 PDF 변환')
+        verbose_name_plural = _('이력서 PDF 변환 목록')
+
+        db_table = 'member_user_resume_pdf_job'
+
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return f'<{self._meta.verbose_name.title()}: {self.resume_id} ({self.status})>'
+
+    @classmethod
+    def get_rendered(cls, digest: str) -> Optional['ResumePDFJob']:
+        """
+        같은 변환 입력(digest)으로 이미 변환된 작업
+        """
+        return cls.objects \
+            .filter(
+                digest=digest,
+                status=cls.Status.done,
+            ) \
+            .exclude(pdf_file__isnull=True) \
+            .exclude(pdf_file='') \
+            .only('id', 'pdf_file') \
+            .order_by('-id') \
+            .first()
+
+    @classmethod
+    def get_by_source(cls, resume_id: int, source_digest: str) -> Optional['ResumePDFJob']:
+        """
+        같은 이력서 데이터(get_resume_pdf_source_digest)로 요청된 최근 작업
+
+        Notes:
+            실패하지 않은 가장 최근 작업의 데이터가 같은 경우에만 반환합니다. (대기 / 처리중 / 완료)
+        """
+        pdf_job = cls.objects \
+            .filter(resume_id=resume_id) \
+            .exclude(status=cls.Status.failed) \
+            .defer('html') \
+            .order_by('-id') \
+            .first()
+
+        if pdf_job and pdf_job.source_digest == source_digest:
+            return pdf_job
+
+        return None
+
+    def use_pdf_file(self, name: str) -> None:
+        """
+        변환된 PDF 파일을 작업과 이력서에 반영
+
+        Notes:
+            이력서의 PDF 가 이미 같은 파일이면 저장하지 않습니다.
+            JSONField(경력 요약 등)를 함께 덮어쓰지 않도록 PDF 필드만 저장합니다.
+        """
+        self.pdf_file = name
+
+        resume = self.resume
+        if resume.pdf_file.name == name and resume.pdf_digest == self.digest:
+            return
+
+        resume.pdf_file = name
+        resume.pdf_digest = self.digest
+        resume.save(update_fields=['pdf_file', 'pdf_digest'])
+
+    @classmethod
+    def enqueue(cls, resume: Resume, html: str, source_digest: Optional[str] = None) -> 'ResumePDFJob':
+        """
+        Args:
+            resume: 이력서
+            html: 변환할 HTML
+            source_digest: 서버에서 HTML 을 생성한 경우 이력서 데이터 digest
+
+        Notes:
+            같은 이력서의 대기중인 이전 작업은 결과가 바로 덮어써지므로 변환하지 않고 실패 처리합니다.
+            같은 입력으로 변환된 PDF 가 있으면 변환 / 업로드 없이 해당 파일을 사용하고 완료 처리합니다.
+        """
+        digest = get_resume_pdf_digest(html)
+
+        cls.objects \
+            .filter(
+                resume_id=resume.id,
+                status=cls.Status.queued,
+            ) \
+            .update(
+                status=cls.Status.failed,
+                last_error='superseded',
+                modified=timezone.now(),
+            )
+
+        rendered = cls.get_rendered(digest)
+        if rendered:
+            pdf_job = cls(
+                resume=resume,
+                html=html,
+                digest=digest,
+                source_digest=source_digest,
+                status=cls.Status.done,
+            )
+            pdf_job.use_pdf_file(rendered.pdf_file.name)
+            pdf_job.save()
+
+            return pdf_job
+
+        pdf_job = cls.objects.create(resume=resume, html=html, digest=digest, source_digest=source_digest)
+
+        if settings.RESUME_PDF_QUEUE_EAGER:
+            from apps.resume.workers import ResumePDFWorker
+            transaction.on_commit(lambda: ResumePDFWorker().run_once())
+
+        return pdf_job
+
+
 class PictureCollection(TimeStampedModel):
     image_id = models.CharField(
         max_length=20,
@@ -0,0 +1,383 @@
+import hashlib
+import json
+import os
+import queue
+import selectors
+import shlex
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from typing import BinaryIO, Dict, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Count, Max, OuterRef, Prefetch, QuerySet, Subquery
+from django.template.loader import get_template, render_to_string
+
+RESUME_PDF_CSS = ".misc/pdf/resume/style.css"
+RESUME_PDF_TEMPLATE = "resume/pdf.html"
+
+# 변환된 PDF 를 메모리에 두는 최대 크기 (초과하면 임시 파일로 옮겨짐)
+RESUME_PDF_SPOOL_MAX_SIZE = 1024 * 1024
+
+RESUME_PDF_OPTIONS = {
+    'page-size': 'A4',
+    'margin-top': '0.40in',
+    'margin-bottom': '0.0in',
+    'margin-right': '0in',
+    'margin-left': '0in',
+    'encoding': "UTF-8",
+    'custom-header': [
+        ('Accept-Encoding', 'gzip')
+    ],
+    'cookie': [
+        ('cookie-name1', 'cookie-value1'),
+        ('cookie-name2', 'cookie-value2'),
+    ],
+    'no-outline': None
+}
+
+
+def get_wkhtmltopdf_args(options: Dict) -> List[str]:
+    """
+    pdfkit 형식의 옵션을 wkhtmltopdf 인자 목록으로 변환
+    """
+    args = []
+    for key, value in options.items():
+        values = value if isinstance(value, list) else [value]
+        for value in values:
+            args.append(f'--{key}')
+            if isinstance(value, (list, tuple)):
+                args.extend(value)
+            elif value is not None:
+                args.append(value)
+
+    return args
+
+
+@lru_cache(maxsize=None)
+def get_resume_pdf_css() -> str:
+    with open(RESUME_PDF_CSS, encoding='utf-8') as f:
+        return f.read()
+
+
+def get_resume_pdf_queryset(queryset: QuerySet) -> QuerySet:
+    """
+    render_resume_html 에서 사용하는 회원 / 프로필 / 병역 / 커리어 / 자격증 / 학력을 함께 조회
+    """
+    Career = apps.get_model('resume', 'Career')
+    Certificate = apps.get_model('resume', 'Certificate')
+    AcademicBackground = apps.get_model('resume', 'AcademicBackground')
+
+    return queryset \
+        .select_related('user__profile', 'military') \
+        .prefetch_related(
+            Prefetch('career_set', Career.objects.order_by('-join_at', '-id')),
+            Prefetch('certificate_set', Certificate.objects.order_by('-certificate_at', '-id')),
+            Prefetch('academic_set', AcademicBackground.objects.order_by('-join_at', '-id')),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_resume_pdf_layout_digest() -> str:
+    """
+    템플릿 / CSS / 옵션의 sha256 digest (배포된 코드가 바뀌면 함께 바뀜)
+    """
+    digest = hashlib.sha256()
+    for part in (get_template(RESUME_PDF_TEMPLATE).template.source, get_resume_pdf_css(),
+                 json.dumps(RESUME_PDF_OPTIONS, sort_keys=True)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def get_resume_pdf_source_digest(resume_id: int) -> Optional[str]:
+    """
+    이력서 HTML 을 만드는 데이터의 변경 여부를 HTML 생성 없이 확인하기 위한 digest
+
+    Notes:
+        회원 / 프로필 / 병역의 수정 시간과 커리어 / 자격증 / 학력의 수 / 최근 수정 시간을 하나의 쿼리로 조회합니다.
+        (삭제는 수로, 생성 / 수정은 수정 시간으로 확인)
+        PDF 저장 등 이력서 자체의 변경은 HTML 에 영향이 없으므로 포함하지 않습니다.
+
+    Returns:
+        이력서가 없으면 None
+    """
+    Resume = apps.get_model('resume', 'Resume')
+
+    def aggregate(model_name: str, **aggregation) -> Subquery:
+        return Subquery(
+            apps.get_model('resume', model_name).objects
+            .filter(resume_id=OuterRef('id'))
+            .order_by()
+            .values('resume_id')
+            .annotate(**aggregation)
+            .values(*aggregation.keys())
+        )
+
+    source = Resume.objects \
+        .filter(id=resume_id) \
+        .annotate(
+            career_count=aggregate('Career', count=Count('id')),
+            career_modified=aggregate('Career', modified=Max('modified')),
+            certificate_count=aggregate('Certificate', count=Count('id')),
+            certificate_modified=aggregate('Certificate', modified=Max('modified')),
+            academic_count=aggregate('AcademicBackground', count=Count('id')),
+            academic_modified=aggregate('AcademicBackground', modified=Max('modified')),
+        ) \
+        .values_list(
+            'user__modified',
+            'user__profile__modified',
+            'military__modified',
+            'career_count',
+            'career_modified',
+            'certificate_count',
+            'certificate_modified',
+            'academic_count',
+            'academic_modified',
+        ) \
+        .first()
+    if source is None:
+        return None
+
+    digest = hashlib.sha256(get_resume_pdf_layout_digest().encode('utf-8'))
+    digest.update(repr(source).encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def render_resume_html(resume) -> str:
+    """
+    이력서 / 커리어 / 자격증 / 학력 / 병역 / 회원 프로필로 이력서 HTML 생성
+
+    Notes:
+        연관 객체를 조회하므로 get_resume_pdf_queryset 으로 가져온 이력서를 사용합니다.
+        같은 데이터로는 항상 같은 HTML 이 만들어지므로, 변환 입력 digest 로 이전 PDF 를 재사용할 수 있습니다.
+    """
+    user = resume.user
+
+    return render_to_string(RESUME_PDF_TEMPLATE, {
+        'resume': resume,
+        'user': user,
+        'profile': getattr(user, 'profile', None),
+        'careers': resume.career_set.all(),
+        'certificates': resume.certificate_set.all(),
+        'academics': resume.academic_set.all(),
+        'military': getattr(resume, 'military', None),
+    })
+
+
+def prepend_css(html: str, css: str) -> str:
+    """
+    pdfkit 의 css 옵션과 동일하게 </head> 앞(없으면 맨 앞)에 style 태그를 추가
+    """
+    style = f'<style>{css}</style>'
+    if '</head>' in html:
+        return html.replace('</head>', style + '</head>')
+
+    return style + html
+
+
+class WkhtmltopdfProcess(object):
+    """
+    여러 변환을 처리하는 wkhtmltopdf 프로세스
+
+    Notes:
+        --read-args-from-stdin 모드로 실행하면 표준 입력의 한 줄을 하나의 변환 인자로 보고 차례대로 변환합니다.
+        변환이 끝날 때마다 표준 에러로 "Done" 이 출력되므로 이를 기다려 완료를 확인합니다.
+    """
+    done_marker = b'Done'
+
+    def __init__(self, command: str):
+        self.renders = 0
+        self.process = subprocess.Popen(
+            [command, '--read-args-from-stdin'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def render(self, html: str, args: List[str], timeout: float, output: BinaryIO) -> None:
+        """
+        변환된 PDF 를 output 에 기록
+
+        Raises:
+            OSError: 프로세스가 종료되었거나 변환에 실패한 경우
+            TimeoutError: timeout(초) 안에 변환이 끝나지 않은 경우
+        """
+        self.renders += 1
+
+        with tempfile.TemporaryDirectory(prefix='resume_pdf_') as tmp_dir:
+            input_path = os.path.join(tmp_dir, 'resume.html')
+            output_path = os.path.join(tmp_dir, 'resume.pdf')
+            with open(input_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+
+            line = ' '.join(shlex.quote(arg) for arg in args + [input_path, output_path])
+            self.process.stdin.write(line.encode('utf-8') + b'\n')
+            self.process.stdin.flush()
+
+            stderr = self.wait_done(timeout)
+
+            if not os.path.exists(output_path) or not os.path.getsize(output_path):
+                raise OSError(f'wkhtmltopdf failed: {stderr.decode("utf-8", "replace").strip()}')
+
+            with open(output_path, 'rb') as f:
+                shutil.copyfileobj(f, output)
+
+    def wait_done(self, timeout: float) -> bytes:
+        output = b''
+        deadline = time.monotonic() + timeout
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.process.stderr, selectors.EVENT_READ)
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f'wkhtmltopdf did not finish in {timeout}s')
+
+                if not selector.select(remaining):
+                    continue
+
+                chunk = os.read(self.process.stderr.fileno(), 65536)
+                if not chunk:
+                    raise OSError(f'wkhtmltopdf exited with code {self.process.wait()}')
+
+                output += chunk
+                # 진행률은 \r 로 같은 줄에 갱신되므로 줄 단위로 나누어 확인
+                if self.done_marker in output.replace(b'\r', b'\n').split(b'\n'):
+                    return output
+
+    def close(self) -> None:
+        if not self.is_alive:
+            return
+
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.wait()
+
+
+class WkhtmltopdfPool(object):
+    """
+    미리 실행해둔 wkhtmltopdf 프로세스 풀
+
+    Notes:
+        동시에 변환하는 수는 size 로 제한되고, 유휴 프로세스가 없으면 새로 실행합니다.
+        max_renders 번 변환한 프로세스(메모리 누수 방지)와 실패 / 시간 초과된 프로세스는 종료하고 다시 실행합니다.
+    """
+
+    def __init__(self, command: str, size: int, max_renders: int, timeout: float):
+        self.command = command
+        self.max_renders = max_renders
+        self.timeout = timeout
+
+        self.semaphore = threading.BoundedSemaphore(size)
+        self.idle_processes = queue.LifoQueue()
+
+    def warm_up(self, count: int) -> None:
+        """
+        첫 변환이 프로세스 실행을 기다리지 않도록 유휴 프로세스를 미리 실행
+        """
+        for _ in range(count - self.idle_processes.qsize()):
+            self.idle_processes.put(WkhtmltopdfProcess(self.command))
+
+    def acquire(self) -> WkhtmltopdfProcess:
+        while True:
+            try:
+                process = self.idle_processes.get_nowait()
+            except queue.Empty:
+                return WkhtmltopdfProcess(self.command)
+
+            if process.is_alive:
+                return process
+
+    def release(self, process: WkhtmltopdfProcess, reusable: bool) -> None:
+        if not reusable:
+            # 변환 중인 상태일 수 있으므로 종료를 기다리지 않음
+            process.kill()
+        elif process.is_alive and process.renders < self.max_renders:
+            self.idle_processes.put(process)
+        else:
+            process.close()
+
+    def render(self, html: str, args: List[str], output: BinaryIO) -> None:
+        with self.semaphore:
+            process = self.acquire()
+            reusable = False
+            try:
+                process.render(html, args, timeout=self.timeout, output=output)
+                reusable = True
+            finally:
+                # 실패한 경우(output 기록 실패 등 포함) 프로세스 상태를 알 수 없으므로 재사용하지 않음
+                self.release(process, reusable=reusable)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self.idle_processes.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_resume_pdf_pool: Optional[WkhtmltopdfPool] = None
+_resume_pdf_pool_lock = threading.Lock()
+
+
+def get_resume_pdf_pool() -> WkhtmltopdfPool:
+    global _resume_pdf_pool
+
+    with _resume_pdf_pool_lock:
+        if _resume_pdf_pool is None:
+            _resume_pdf_pool = WkhtmltopdfPool(
+                command=settings.RESUME_PDF_WKHTMLTOPDF,
+                size=settings.RESUME_PDF_POOL_SIZE,
+                max_renders=settings.RESUME_PDF_POOL_MAX_RENDERS,
+                timeout=settings.RESUME_PDF_TIMEOUT,
+            )
+
+    return _resume_pdf_pool
+
+
+def get_resume_pdf_digest(html: str) -> str:
+    """
+    변환 입력(HTML / CSS / 옵션)의 sha256 digest
+
+    Notes:
+        입력이 같으면 같은 PDF 가 만들어지므로, 이미 변환된 PDF 를 찾는 키로 사용합니다.
+    """
+    digest = hashlib.sha256()
+    for part in (html, get_resume_pdf_css(), json.dumps(RESUME_PDF_OPTIONS, sort_keys=True)):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def render_resume_pdf(html: str, output: BinaryIO) -> None:
+    """
+    이력서 HTML 을 wkhtmltopdf 프로세스 풀에서 PDF 로 변환하여 output 에 기록
+
+    Notes:
+        PDF 전체를 bytes 로 읽지 않고 wkhtmltopdf 의 출력 파일에서 나누어 복사합니다.
+
+    Raises:
+        OSError: wkhtmltopdf 실행 실패, 변환 실패 또는 시간 초과
+    """
+    html = prepend_css(html, get_resume_pdf_css())
+
+    get_resume_pdf_pool().render(html, get_wkhtmltopdf_args(RESUME_PDF_OPTIONS), output)
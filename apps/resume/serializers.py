@@ -3,7 +3,6 @@ import random
 import uuid
 from http import HTTPStatus
 
-from django.core.files.base import ContentFile
 from django.utils.translation.trans_null import gettext_lazy
 from drf_spectacular.utils import extend_schema_serializer, OpenApiExample
 from rest_auth.utils import jwt_encode
@@ -20,11 +19,12 @@ from rest_framework import serializers, fields
 from phonenumber_field.serializerfields import PhoneNumberField
 from phonenumber_field.phonenumber import PhoneNumber
 
-from apps.resume.models import Resume, Career, Certificate, AcademicBackground, MilitaryService
-from utils.django.rest_framework.serializers import SimpleSerializer, ModelSerializer
+from apps.resume.models import Resume, Career, Certificate, AcademicBackground, MilitaryService, ResumePDFJob
+from apps.resume.pdf import get_resume_pdf_queryset, get_resume_pdf_source_digest, render_resume_html
+from utils.django.rest_framework.serializers import CompiledRepresentationMixin, SimpleSerializer, ModelSerializer
 
 
-class CareerSerializer(ModelSerializer):
+class CareerSerializer(CompiledRepresentationMixin, ModelSerializer):
     class Meta:
         model = Career
         fields = (
@@ -39,13 +39,13 @@ class CareerSerializer(ModelSerializer):
         read_only_fields = ()
 
     def create(self, validated_data):
-        user = self.context['user']
-        career = Career.objects.create(resume=user.resume, **validated_data)
+        resume_id = self.context['view'].resume_id
+        career = Career.objects.create(resume_id=resume_id, **validated_data)
 
         return career
 
 
-class CertificateSerializer(ModelSerializer):
+class CertificateSerializer(CompiledRepresentationMixin, ModelSerializer):
     class Meta:
         model = Certificate
         fields = (
@@ -58,13 +58,13 @@ class CertificateSerializer(ModelSerializer):
         read_only_fields = ()
 
     def create(self, validated_data):
-        user = self.context['user']
-        certificate = Certificate.objects.create(resume=user.resume, **validated_data)
+        resume_id = self.context['view'].resume_id
+        certificate = Certificate.objects.create(resume_id=resume_id, **validated_data)
 
         return certificate
 
 
-class AcademicBackgroundSerializer(ModelSerializer):
+class AcademicBackgroundSerializer(CompiledRepresentationMixin, ModelSerializer):
     class Meta:
         model = AcademicBackground
         fields = (
@@ -79,13 +79,13 @@ class AcademicBackgroundSerializer(ModelSerializer):
         read_only_fields = ()
 
     def create(self, validated_data):
-        user = self.context['user']
-        academic_background = AcademicBackground.objects.create(resume=user.resume, **validated_data)
+        resume_id = self.context['view'].resume_id
+        academic_background = AcademicBackground.objects.create(resume_id=resume_id, **validated_data)
 
         return academic_background
 
 
-class MilitaryServiceSerializer(ModelSerializer):
+class MilitaryServiceSerializer(CompiledRepresentationMixin, ModelSerializer):
     class Meta:
         model = MilitaryService
         fields = (
@@ -99,13 +99,13 @@ class MilitaryServiceSerializer(ModelSerializer):
         read_only_fields = ()
 
     def create(self, validated_data):
-        user = self.context['user']
-        military_service = MilitaryService.objects.create(resume=user.resume, **validated_data)
+        resume_id = self.context['view'].resume_id
+        military_service = MilitaryService.objects.create(resume_id=resume_id, **validated_data)
 
         return military_service
 
 
-class ResumeSerializer(ModelSerializer):
+class ResumeSerializer(CompiledRepresentationMixin, ModelSerializer):
     class Meta:
         model = Resume
         fields = (
@@ -141,68 +141,47 @@ class UserResumeSerializer(ModelSerializer):
     military = MilitaryServiceSerializer()
 
 
-class ResumePDFSerializer(ModelSerializer):
+class ResumePDFJobSerializer(ModelSerializer):
     class Meta:
-        model = Resume
+        model = ResumePDFJob
         fields = (
+            "id",
             "html",
+            "status",
             "pdf_file",
+            "created",
+            "modified",
         )
 
         read_only_fields = (
-            'pdf_file',
+            "id",
+            "status",
+            "pdf_file",
+            "created",
+            "modified",
         )
 
     # WRITE ONLY
-    # html = serializers.FileField(
-    #     label=gettext_lazy('PDF HTML'),
-    #     required=True,
-    #     allow_null=False,
-    #     write_only=True,
-    # )
     html = serializers.CharField(
         label=gettext_lazy('PDF HTML'),
-        required=True,
+        required=False,
         allow_null=False,
         write_only=True,
     )
 
-    def update(self, request, *args, **kwargs):
-        import pdfkit
-
-        resume: Resume = request
-        html = self.validated_data.get('html')
-        options = {
-            'page-size': 'A4',
-            'margin-top': '0.40in',
-            'margin-bottom': '0.0in',
-            'margin-right': '0in',
-            'margin-left': '0in',
-            'encoding': "UTF-8",
-            'custom-header': [
-                ('Accept-Encoding', 'gzip')
-            ],
-            'cookie': [
-                ('cookie-name1', 'cookie-value1'),
-                ('cookie-name2', 'cookie-value2'),
-            ],
-            'no-outline': None
-        }
-
-        css = ".misc/pdf/resume/style.css"
-        try:
-            html_str = html
-            pdf = pdfkit.from_string(html_str, False, css=css, options=options)
-        except OSError as e:
-            resume.pdf_file = ''
-
-            return resume
-        except Exception as e:
-            raise e
-
-        ticket_pdf = ContentFile(pdf, name=f'{resume.user.id}_{resume.id}' + '.pdf')
-
-        resume.pdf_file = ticket_pdf
-        resume.save()
-
-        return resume
+    def create(self, validated_data):
+        resume = validated_data['resume']
+
+        html = validated_data.get('html')
+        if html:
+            return ResumePDFJob.enqueue(resume=resume, html=html)
+
+        # 서버에서 HTML 을 생성하는 경우, 이력서 데이터가 바뀌지 않았으면 HTML 생성 / 작업 저장 없이 이전 작업을 반환
+        source_digest = get_resume_pdf_source_digest(resume.id)
+        pdf_job = ResumePDFJob.get_by_source(resume.id, source_digest)
+        if pdf_job:
+            return pdf_job
+
+        html = render_resume_html(get_resume_pdf_queryset(Resume.objects.filter(id=resume.id)).get())
+
+        return ResumePDFJob.enqueue(resume=resume, html=html, source_digest=source_digest)
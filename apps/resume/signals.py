@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.member.caches import ResumeUserCache, UserCache
+from apps.resume.models import AcademicBackground, Certificate, MilitaryService, Resume
+
+
+@receiver(post_save, sender=Resume)
+@receiver(post_delete, sender=Resume)
+def invalidate_resume_cache(sender, instance: Resume, **kwargs):
+    # 커밋 전에 버전이 올라가면 커밋 전의 데이터가 새 버전으로 캐시될 수 있음
+    transaction.on_commit(lambda: UserCache.bump_version(instance.user_id))
+
+
+@receiver(post_save, sender=Certificate)
+@receiver(post_delete, sender=Certificate)
+@receiver(post_save, sender=AcademicBackground)
+@receiver(post_delete, sender=AcademicBackground)
+@receiver(post_save, sender=MilitaryService)
+@receiver(post_delete, sender=MilitaryService)
+def invalidate_resume_item_cache(sender, instance, **kwargs):
+    user_id = ResumeUserCache.get_user_id(instance.resume_id)
+    if user_id is None:
+        return
+
+    transaction.on_commit(lambda: UserCache.bump_version(user_id))
@@ -25,6 +25,11 @@ urlpatterns = [
         views.UserMeResumeDetailPDFView.as_view(),
         name=views.UserMeResumeDetailPDFView.__name__,
     ),
+    path(
+        "user/me/resume/pdf/jobs/<int:job_id>/",
+        views.UserMeResumePDFJobDetailView.as_view(),
+        name=views.UserMeResumePDFJobDetailView.__name__,
+    ),
     path(
         "user/me/resume/careers/",
         views.ResumeCareerListView.as_view(),
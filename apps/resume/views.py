@@ -3,7 +3,9 @@ from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiParameter
 from rest_framework.exceptions import NotFound
 
+from rest_framework import status
 from rest_framework.generics import (
+    GenericAPIView,
     ListCreateAPIView,
     RetrieveUpdateAPIView,
     RetrieveUpdateDestroyAPIView,
@@ -13,23 +15,28 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, AllowAny
 
+from apps.member.caches import ResumeUserCache, UserResponseCache
 from apps.member.models import User
 from apps.resume import models
 from apps.resume import serializers
-from apps.resume.models import Career, Certificate, AcademicBackground, MilitaryService, Resume
-from utils.django.rest_framework.mixins import UserContextMixin, QuerySerializerMixin
+from apps.resume.models import Career, Certificate, AcademicBackground, MilitaryService, Resume, ResumePDFJob
+from utils.django.rest_framework.mixins import UserContextMixin, QuerySerializerMixin, VersionedResponseCacheMixin
 
 from commons.contrib.drf_spectacular import tags as api_tags
 
 
-class ResumeDetailView(UserContextMixin, RetrieveAPIView):
+class ResumeDetailView(VersionedResponseCacheMixin, UserContextMixin, RetrieveAPIView):
     permission_classes = (AllowAny, )
     serializer_class = serializers.ResumeSerializer
+    response_cache_class = UserResponseCache
 
     queryset = Resume.objects
     lookup_field = 'id'
     lookup_url_kwarg = 'resume_id'
 
+    def get_response_cache_owner_id(self):
+        return ResumeUserCache.get_user_id(self.kwargs['resume_id'])
+
     @extend_schema(
         tags=[api_tags.RESUME],
         summary="회원 이력서 가져오기 API @AllowAny",
@@ -40,9 +47,13 @@ class ResumeDetailView(UserContextMixin, RetrieveAPIView):
         return super(ResumeDetailView, self).get(request, *args, **kwargs)
 
 
-class UserResumeDetailView(UserContextMixin, RetrieveAPIView):
+class UserResumeDetailView(VersionedResponseCacheMixin, UserContextMixin, RetrieveAPIView):
     permission_classes = (AllowAny, )
     serializer_class = serializers.UserResumeSerializer
+    response_cache_class = UserResponseCache
+
+    def get_response_cache_owner_id(self):
+        return self.kwargs.get('user_id', None)
 
     def get_object(self):
         user_id = self.kwargs.get('user_id', None)
@@ -80,27 +91,58 @@ class UserMeResumeDetailView(UserContextMixin, RetrieveAPIView):
         return super(UserMeResumeDetailView, self).get(request, *args, **kwargs)
 
 
-class UserMeResumeDetailPDFView(UserContextMixin, RetrieveUpdateAPIView):
+class UserMeResumeDetailPDFView(UserContextMixin, GenericAPIView):
     permission_classes = (IsAuthenticated, )
-    serializer_class = serializers.ResumePDFSerializer
+    serializer_class = serializers.ResumePDFJobSerializer
 
-    def get_object(self):
+    @extend_schema(
+        tags=[api_tags.USER_ME],
+        summary="회원 이력서 PDF 업데이트 API @IsAuthenticated",
+        description="회원 이력서 PDF 변환 작업을 요청하는 API 입니다.\n"
+                    "html 을 생략하면 서버에서 이력서 데이터로 HTML 을 생성합니다.\n"
+                    "변환은 백그라운드에서 처리되며, 반환된 작업 id 로 진행 상태와 PDF 파일을 조회할 수 있습니다.\n"
+                    "이력서가 변경되지 않았으면 새로운 작업 없이 이전 작업(완료된 경우 이전 PDF)이 반환됩니다.",
+        responses={202: serializers.ResumePDFJobSerializer},
+    )
+    def patch(self, request, *args, **kwargs):
         resume, is_created = Resume.objects.get_or_create(user_id=self.user.id)
 
-        return resume
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(resume=resume)
+
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
-    def __init__(self, *args, **kwargs):
-        self.http_method_names = [method for method in self.http_method_names if method != "put" and method != "get"]
-        super(UserMeResumeDetailPDFView, self).__init__(*args, **kwargs)
+
+class UserMeResumePDFJobDetailView(UserContextMixin, RetrieveAPIView):
+    permission_classes = (IsAuthenticated, )
+    serializer_class = serializers.ResumePDFJobSerializer
+
+    lookup_field = 'id'
+    lookup_url_kwarg = 'job_id'
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False):
+            return ResumePDFJob.objects.none()
+
+        return ResumePDFJob.objects \
+            .filter(resume_id=self.resume_id) \
+            .defer('html') \
+            .all()
 
     @extend_schema(
         tags=[api_tags.USER_ME],
-        summary="회원 이력서 PDF 업데이트 API @IsAuthenticated",
-        description="회원 이력서 PDF 업데이트 API 입니다.",
-        responses=serializers.ResumePDFSerializer,
+        summary="회원 이력서 PDF 변환 상태 가져오기 API @IsAuthenticated",
+        description="회원 이력서 PDF 변환 작업의 상태를 가져오는 API 입니다.\n"
+                    "* **Status**\n"
+                    "    * **queued** - 대기중\n"
+                    "    * **processing** - 처리중\n"
+                    "    * **done** - 완료됨 (pdfFile 포함)\n"
+                    "    * **failed** - 실패함",
+        responses=serializers.ResumePDFJobSerializer,
     )
-    def patch(self, request, *args, **kwargs):
-        return super(UserMeResumeDetailPDFView, self).patch(request, *args, **kwargs)
+    def get(self, request, *args, **kwargs):
+        return super(UserMeResumePDFJobDetailView, self).get(request, *args, **kwargs)
 
 
 class ResumeCareerDetailView(UserContextMixin, RetrieveUpdateDestroyAPIView):
@@ -119,7 +161,7 @@ class ResumeCareerDetailView(UserContextMixin, RetrieveUpdateDestroyAPIView):
             return Career.objects.none()
 
         return Career.objects \
-            .filter(resume_id=self.user.resume.id) \
+            .filter(resume_id=self.resume_id) \
             .order_by('-join_at') \
             .all()
 
@@ -163,7 +205,7 @@ class ResumeCareerListView(UserContextMixin, ListCreateAPIView):
             return Career.objects.none()
 
         return Career.objects \
-            .filter(resume_id=self.user.resume.id) \
+            .filter(resume_id=self.resume_id) \
             .order_by('-join_at') \
             .all()
 
@@ -212,7 +254,7 @@ class ResumeCertificateDetailView(UserContextMixin, RetrieveUpdateDestroyAPIView
             return Certificate.objects.none()
 
         return Certificate.objects \
-            .filter(resume_id=self.user.resume.id) \
+            .filter(resume_id=self.resume_id) \
             .order_by('-certificate_at') \
             .all()
 
@@ -256,7 +298,7 @@ class ResumeCertificateListView(UserContextMixin, ListCreateAPIView):
             return Certificate.objects.none()
 
         return Certificate.objects \
-            .filter(resume_id=self.user.resume.id) \
+            .filter(resume_id=self.resume_id) \
             .order_by('-certificate_at') \
             .all()
 
@@ -295,7 +337,7 @@ class ResumeAcademicBackgroundDetailView(UserContextMixin, RetrieveUpdateDestroy
             return AcademicBackground.objects.none()
 
         return AcademicBackground.objects \
-            .filter(resume_id=self.user.resume.id) \
+            .filter(resume_id=self.resume_id) \
             .order_by('-join_at') \
             .all()
 
@@ -335,7 +377,7 @@ class ResumeAcademicBackgroundListView(UserContextMixin, ListCreateAPIView):
             return AcademicBackground.objects.none()
 
         return AcademicBackground.objects \
-            .filter(resume_id=self.user.resume.id) \
+            .filter(resume_id=self.resume_id) \
             .order_by('-join_at') \
             .all()
 
@@ -367,7 +409,7 @@ class ResumeMilitaryServiceView(UserContextMixin, RetrieveUpdateAPIView):
     serializer_class = serializers.MilitaryServiceSerializer
 
     def get_object(self):
-        military, is_created = MilitaryService.objects.get_or_create(resume_id=self.user.resume.id)
+        military, is_created = MilitaryService.objects.get_or_create(resume_id=self.resume_id)
 
         return military
 
@@ -0,0 +1,66 @@
+import tempfile
+from typing import List
+
+from django.core.files import File
+
+from apps.resume.models import Resume, ResumePDFJob
+from apps.resume.pdf import RESUME_PDF_SPOOL_MAX_SIZE, get_resume_pdf_digest, render_resume_pdf
+from utils.django.workers import QueueWorker
+
+
+class ResumePDFWorker(QueueWorker):
+    """
+    ResumePDFJob 변환 작업자
+
+    Notes:
+        변환 한 건에 수 초가 걸리므로 한 번에 하나씩 가져와, 여러 작업자가 대기중인 작업을 나누어 처리합니다.
+    """
+    model = ResumePDFJob
+    batch_size = 1
+
+    def process(self, tasks: List[ResumePDFJob]) -> None:
+        for pdf_job in tasks:
+            self.render(pdf_job)
+
+    def render(self, pdf_job: ResumePDFJob) -> None:
+        # 재시도 중인 작업이 이후에 요청된 작업의 결과를 덮어쓰지 않도록 함
+        if ResumePDFJob.objects \
+                .filter(
+                    resume_id=pdf_job.resume_id,
+                    id__gt=pdf_job.id,
+                    status=ResumePDFJob.Status.done,
+                ) \
+                .exists():
+            self.fail(pdf_job, 'superseded', retry=False)
+            return
+
+        if not pdf_job.digest:
+            pdf_job.digest = get_resume_pdf_digest(pdf_job.html)
+
+        # PDF 필드만 갱신하므로 경력 요약 등 JSONField 는 가져오지 않음
+        pdf_job.resume = Resume.objects \
+            .only('id', 'user_id', 'pdf_file', 'pdf_digest') \
+            .get(id=pdf_job.resume_id)
+
+        # 대기중에 같은 입력의 다른 작업이 변환되었으면 변환 / 업로드 없이 해당 파일을 사용
+        rendered = ResumePDFJob.get_rendered(pdf_job.digest)
+        if rendered:
+            pdf_job.use_pdf_file(rendered.pdf_file.name)
+            self.succeed(pdf_job, update_fields=['pdf_file', 'digest'])
+            return
+
+        # 변환된 PDF 는 RESUME_PDF_SPOOL_MAX_SIZE 까지만 메모리에 두고, 파일 그대로 저장소에 업로드
+        with tempfile.SpooledTemporaryFile(max_size=RESUME_PDF_SPOOL_MAX_SIZE) as pdf:
+            try:
+                render_resume_pdf(pdf_job.html, pdf)
+            except OSError as e:
+                self.fail(pdf_job, repr(e))
+                return
+
+            resume = pdf_job.resume
+            resume.pdf_file.save(f'{resume.user_id}_{resume.id}.pdf', File(pdf), save=False)
+            resume.pdf_digest = pdf_job.digest
+            resume.save(update_fields=['pdf_file', 'pdf_digest'])
+
+        pdf_job.pdf_file = resume.pdf_file.name
+        self.succeed(pdf_job, update_fields=['pdf_file', 'digest'])
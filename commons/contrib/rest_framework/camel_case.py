@@ -0,0 +1,94 @@
+from functools import lru_cache
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.util import camelize_re, get_underscoreize_re, underscore_to_camel
+
+# 응답 / 요청의 키는 종류가 한정되어 있으므로 변환 결과를 재사용 (요청 키는 외부 입력이므로 개수 제한)
+KEY_CACHE_SIZE = 4096
+
+underscoreize_res = {
+    no_underscore_before_number: get_underscoreize_re(dict(no_underscore_before_number=no_underscore_before_number))
+    for no_underscore_before_number in (False, True)
+}
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def camelize_key(key: str) -> str:
+    return camelize_re.sub(underscore_to_camel, key)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def underscoreize_key(key: str, no_underscore_before_number=False) -> str:
+    return underscoreize_res[bool(no_underscore_before_number)].sub(r"\1_\2", key).lower()
+
+
+def camelize(data, ignore_fields=None, **options):
+    """
+    djangorestframework_camel_case.util.camelize 와 같은 결과를 반환
+
+    Notes:
+        키 변환 결과를 재사용하고, dict 는 OrderedDict / ReturnDict 대신 dict 로 반환합니다.
+    """
+    if data is None or data.__class__ in (str, int, float, bool):
+        return data
+
+    if isinstance(data, Promise):
+        data = force_str(data)
+
+    if isinstance(data, dict):
+        new_dict = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            if isinstance(key, str) and "_" in key:
+                new_key = camelize_key(key)
+            else:
+                new_key = key
+            if not ignore_fields or (key not in ignore_fields and new_key not in ignore_fields):
+                new_dict[new_key] = camelize(value, ignore_fields=ignore_fields, **options)
+            else:
+                new_dict[new_key] = value
+        return new_dict
+
+    if isinstance(data, str):
+        return data
+
+    try:
+        iterable = iter(data)
+    except TypeError:
+        return data
+    return [camelize(item, ignore_fields=ignore_fields, **options) for item in iterable]
+
+
+def underscoreize_json(data, ignore_fields=None, no_underscore_before_number=False, **options):
+    """
+    JSON 으로 파싱된 값(dict / list / 기본 타입)에 대해 djangorestframework_camel_case.util.underscoreize 와 같은 결과를 반환
+    """
+    if isinstance(data, dict):
+        new_dict = {}
+        for key, value in data.items():
+            new_key = underscoreize_key(key, no_underscore_before_number) if isinstance(key, str) else key
+            if not ignore_fields or (key not in ignore_fields and new_key not in ignore_fields):
+                new_dict[new_key] = underscoreize_json(
+                    value,
+                    ignore_fields=ignore_fields,
+                    no_underscore_before_number=no_underscore_before_number,
+                    **options,
+                )
+            else:
+                new_dict[new_key] = value
+        return new_dict
+
+    if isinstance(data, list):
+        return [
+            underscoreize_json(
+                item,
+                ignore_fields=ignore_fields,
+                no_underscore_before_number=no_underscore_before_number,
+                **options,
+            )
+            for item in data
+        ]
+
+    return data
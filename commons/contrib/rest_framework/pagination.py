@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination as BaseCursorPagination
+
+
+class CursorPagination(BaseCursorPagination):
+    """
+    id 역순 cursor 페이지네이션
+
+    Notes:
+        OFFSET 없이 마지막으로 조회한 id 를 기준으로 다음 페이지를 조회하므로 페이지가 뒤로 갈수록 느려지지 않습니다.
+        페이지 크기는 limit 쿼리 파라미터로 최대 max_page_size 까지 지정할 수 있습니다.
+    """
+    page_size = 20
+    page_size_query_param = 'limit'
+    max_page_size = 100
+    ordering = '-id'
@@ -1,5 +1,45 @@
+import json
+import re
+
+import orjson
+from django.conf import settings
 from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from rest_framework.exceptions import ParseError
+
+from commons.contrib.rest_framework.camel_case import underscoreize_json
 
 
 class NoUnderscoreBeforeNumberCamelCaseJSONParser(CamelCaseJSONParser):
     json_underscoreize = {"no_underscore_before_number": True}
+
+
+class OrjsonCamelCaseJSONParser(CamelCaseJSONParser):
+    """
+    NoUnderscoreBeforeNumberCamelCaseJSONParser 와 같은 결과를 orjson 으로 파싱하는 parser
+
+    Notes:
+        orjson 이 파싱할 수 없는 값(NaN 등)이 있는 경우에는 json 모듈로 파싱합니다.
+        orjson 은 64비트를 넘는 정수를 float 로 파싱하므로, 19자리 이상의 숫자가 있으면 json 모듈로 파싱합니다.
+    """
+    json_underscoreize = {"no_underscore_before_number": True}
+    long_number_re = re.compile(r"[0-9]{19,}")
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = stream.read().decode(encoding)
+            return underscoreize_json(self.loads(data), **self.json_underscoreize)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+    # noinspection PyMethodMayBeStatic
+    def loads(self, data: str):
+        if not self.long_number_re.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+
+        return json.loads(data)
@@ -0,0 +1,68 @@
+import math
+import re
+from decimal import Decimal
+
+import orjson
+from djangorestframework_camel_case.settings import api_settings
+from rest_framework.renderers import JSONRenderer
+
+from commons.contrib.rest_framework.camel_case import camelize
+
+
+def has_non_finite_number(data) -> bool:
+    """
+    NaN / Infinity 인 float / Decimal 이 있는지 확인
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, Decimal):
+        return not data.is_finite()
+    if isinstance(data, dict):
+        return any(has_non_finite_number(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_non_finite_number(value) for value in data)
+
+    return False
+
+
+class OrjsonCamelCaseJSONRenderer(JSONRenderer):
+    """
+    CamelCaseJSONRenderer 와 같은 출력을 orjson 으로 인코딩하는 renderer
+
+    Notes:
+        DRF JSONRenderer 의 기본 설정(UNICODE_JSON / COMPACT_JSON)과 같은 바이트를 출력하며,
+        indent 가 지정된 경우나 인코딩할 수 없는 값(64비트를 넘는 정수 등)이 있는 경우에는
+        DRF JSONRenderer 로 인코딩합니다.
+        날짜 / 시간 등 JSON 기본 타입이 아닌 값은 DRF JSONEncoder 와 같은 형식으로 변환합니다.
+        지수 표기 float 는 json 모듈과 표기가 다르므로(1e-07 / 1e-7) 출력에 지수 표기 숫자가 있으면 다시 인코딩합니다.
+        orjson 은 NaN / Infinity 를 null 로 인코딩하므로, 출력에 null 이 있고 해당 값이 있으면
+        DRF JSONRenderer 로 인코딩하여 같은 예외(ValueError)가 발생하도록 합니다.
+    """
+    exponent_number_re = re.compile(rb'[:,\[]-?[0-9]+(?:\.[0-9]+)?e')
+    orjson_option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        data = camelize(data, **api_settings.JSON_UNDERSCOREIZE)
+
+        if (
+            data is None
+            or self.ensure_ascii
+            or not self.strict
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super(OrjsonCamelCaseJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.orjson_option)
+        except orjson.JSONEncodeError:
+            return super(OrjsonCamelCaseJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        if self.exponent_number_re.search(ret):
+            return super(OrjsonCamelCaseJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        if b'null' in ret and has_non_finite_number(data):
+            return super(OrjsonCamelCaseJSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        # JSONRenderer 와 같이 \u2028 / \u2029 는 escape
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -1,3 +1,9 @@
+from django.core.management import call_command
+
 
 def hello_every_minute():
     print('hello')
+
+
+def prune_member_records():
+    call_command('prune_member_records')
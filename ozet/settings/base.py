@@ -130,6 +130,21 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://github.com/jazzband/django-redis
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/0'),
+        'KEY_PREFIX': 'ozet',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # 캐시 장애시 DB 로 fallback 되도록 예외를 무시
+            'IGNORE_EXCEPTIONS': True,
+        },
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -180,21 +195,34 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': (
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
+        'commons.contrib.rest_framework.render.OrjsonCamelCaseJSONRenderer',
         'djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
-        'commons.contrib.rest_framework.parser.NoUnderscoreBeforeNumberCamelCaseJSONParser',
+        'commons.contrib.rest_framework.parser.OrjsonCamelCaseJSONParser',
         'djangorestframework_camel_case.parser.CamelCaseFormParser',
         'djangorestframework_camel_case.parser.CamelCaseMultiPartParser',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_THROTTLE_RATES': {
+        # 패스코드 요청 (apps.member.throttles)
+        'passcode_phone_number': '5/hour',
+        'passcode_client_ip': '60/hour',
+    },
     'POSTPROCESSING_HOOKS': [
         'drf_spectacular.hooks.postprocess_schema_enums',
         'drf_spectacular.contrib.djangorestframework_camel_case.camelize_serializer_fields',
     ],
 }
 
+# drf-spectacular
+SPECTACULAR_SETTINGS = {
+    # 같은 이름(status)의 선택지 필드가 여러 개일 때 기존 enum 이름이 바뀌지 않도록 고정
+    'ENUM_NAME_OVERRIDES': {
+        'StatusEnum': 'apps.member.models.UserPasscodeVerify.Status',
+    },
+}
+
 # Authentication
 # https://docs.djangoproject.com/ko/2.1/topics/auth/customizing/#substituting-a-custom-user-model
 AUTH_USER_MODEL = 'member.User'
@@ -215,6 +243,32 @@ JWT_AUTH = {
     'JWT_EXPIRATION_DELTA': datetime.timedelta(days=15),
 }
 
+# Member
+# 만료된 회원 토큰 / 소셜 토큰 / 패스코드 인증 요청 보관 기간 (prune_member_records)
+MEMBER_TOKEN_RETENTION = datetime.timedelta(days=1)
+MEMBER_SOCIAL_TOKEN_RETENTION = datetime.timedelta(days=1)
+MEMBER_PASSCODE_VERIFY_RETENTION = datetime.timedelta(days=7)
+MEMBER_PRUNE_BATCH_SIZE = 1000
+
+# 패스코드 인증 요청 저장소
+# 캐시 사용시: 'apps.member.passcodes.CachePasscodeBackend'
+PASSCODE_BACKEND = os.environ.get('PASSCODE_BACKEND', 'apps.member.passcodes.DatabasePasscodeBackend')
+
+# SMS 발송 큐 (run_sms_worker / run_sms_delivery_worker, 컨테이너에서는 .misc/docker/start.sh 로 실행)
+# True 일 경우 작업자 없이 커밋 이후 즉시 발송
+SMS_QUEUE_EAGER = False
+
+# 이력서 PDF 변환 큐 (run_resume_pdf_worker, 컨테이너에서는 .misc/docker/start.sh 로 실행)
+# True 일 경우 작업자 없이 커밋 이후 즉시 변환
+RESUME_PDF_QUEUE_EAGER = False
+
+# 이력서 PDF 변환 wkhtmltopdf 프로세스 풀 (apps.resume.pdf)
+# 동시 변환 수 / 프로세스당 최대 변환 수 / 변환 시간 제한(초)
+RESUME_PDF_WKHTMLTOPDF = os.environ.get('RESUME_PDF_WKHTMLTOPDF', 'wkhtmltopdf')
+RESUME_PDF_POOL_SIZE = 2
+RESUME_PDF_POOL_MAX_RENDERS = 100
+RESUME_PDF_TIMEOUT = 30
+
 # django-cors-headers
 if DEBUG:
     CORS_ORIGIN_ALLOW_ALL = True
@@ -6,4 +6,5 @@ INSTAGRAM_OAUTH_REDIRECT_URL = "https://api.ozet.app/api/v1/member/user/me/insta
 
 CRONJOBS = [
     ('* * * * *', 'ozet.cron.hello_every_minute', '>> ./tmp/log/ggbc_cron.log'),
+    ('30 4 * * *', 'ozet.cron.prune_member_records', '>> ./tmp/log/ggbc_cron.log'),
 ]
@@ -3,3 +3,13 @@
 from .base import *
 
 CRONJOBS = []
+
+BACKGROUND_TASK_ALWAYS_EAGER = True
+SMS_QUEUE_EAGER = True
+RESUME_PDF_QUEUE_EAGER = True
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
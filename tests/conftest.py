@@ -0,0 +1,45 @@
+import os
+
+import django
+import pytest
+from django.conf import settings
+
+if not os.environ.get('DJANGO_SETTINGS_MODULE') and not settings.configured:
+    from ozet.settings import test as test_settings
+
+    test_settings_dict = {name: getattr(test_settings, name) for name in dir(test_settings) if name.isupper()}
+    test_settings_dict.update(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+            },
+        },
+        # AnnouncementConfig.ready 는 테이블 생성 전에 DB 를 조회하므로 제외
+        INSTALLED_APPS=[app for app in test_settings.INSTALLED_APPS if app != 'apps.announcement'],
+    )
+    settings.configure(**test_settings_dict)
+django.setup()
+
+
+@pytest.fixture(scope='session')
+def django_test_database(request):
+    """
+    테스트 DB 생성 (Django TestCase 는 usefixtures 로 사용)
+
+    Notes:
+        pytest-django 가 설치된 환경에서는 pytest-django 가 생성한 테스트 DB 를 사용합니다.
+    """
+    if request.config.pluginmanager.hasplugin('django'):
+        request.getfixturevalue('django_db_setup')
+        yield
+        return
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    yield
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+    teardown_test_environment()
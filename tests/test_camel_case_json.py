@@ -0,0 +1,128 @@
+import datetime
+import decimal
+import io
+import os
+import uuid
+from collections import OrderedDict
+
+import django
+import pytest
+from django.conf import settings
+
+if not os.environ.get('DJANGO_SETTINGS_MODULE') and not settings.configured:
+    settings.configure()
+django.setup()
+
+from django.utils.translation import gettext_lazy as _  # noqa: E402
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer  # noqa: E402
+from rest_framework.exceptions import ParseError  # noqa: E402
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList  # noqa: E402
+
+from commons.contrib.rest_framework.parser import (  # noqa: E402
+    NoUnderscoreBeforeNumberCamelCaseJSONParser,
+    OrjsonCamelCaseJSONParser,
+)
+from commons.contrib.rest_framework.render import OrjsonCamelCaseJSONRenderer  # noqa: E402
+
+RENDER_CASES = [
+    None,
+    {},
+    [],
+    'plain string',
+    {
+        'id': 1,
+        'user_name': '김헤어',
+        'phone_number': '+821012345678',
+        'policy_for_terms_agreed': '2021-12-11T03:07:48.706758',
+        'address_1': 'line separator \u2028 paragraph separator \u2029',
+        'control_chars': '\x00\x1f\t\n"\\/',
+        'is_registration': True,
+        'profile_image': None,
+        'pay_amount': 2500000,
+        'ratio': 0.1,
+        'float_values': [1.5, 123.456, -0.0, 12345678.9],
+        '_private_key': 1,
+        'double__underscore': 2,
+        'trailing_': 3,
+        'UPPER_CASE': 4,
+        1: 'int key',
+    },
+    {
+        'created': datetime.datetime(2022, 4, 17, 17, 48, 1, 123456),
+        'birthday': datetime.date(1997, 7, 12),
+        'working_hour': datetime.time(10, 30, 15, 500000),
+        'amount': decimal.Decimal('10.50'),
+        'request_id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'duration': datetime.timedelta(days=1, seconds=30),
+        'lazy_value': _('이력서'),
+        _('lazy_key'): 'value',
+        'tuple_value': ('a_b', {'c_d': 1}),
+        'ordered_dict': OrderedDict([('z_key', 1), ('a_key', [{'nested_key': None}])]),
+    },
+    # orjson 으로 인코딩할 수 없는 값은 JSONRenderer 로 인코딩
+    {'big_int': 2 ** 70},
+    {'exponent_floats': [1e-7, 1e16, 1.5e300]},
+    ReturnList(
+        [ReturnDict([('career_summary', [{'position': 'STAFF', 'is_working': False}])], serializer=None)],
+        serializer=None,
+    ),
+]
+
+
+@pytest.mark.parametrize('data', RENDER_CASES)
+def test_renderer_output_matches_camel_case_json_renderer(data):
+    assert OrjsonCamelCaseJSONRenderer().render(data) == CamelCaseJSONRenderer().render(data)
+
+
+@pytest.mark.parametrize('accepted_media_type', ['application/json; indent=4', 'application/json; indent=0'])
+def test_renderer_indent_matches_camel_case_json_renderer(accepted_media_type):
+    data = RENDER_CASES[4]
+
+    assert (
+        OrjsonCamelCaseJSONRenderer().render(data, accepted_media_type, {})
+        == CamelCaseJSONRenderer().render(data, accepted_media_type, {})
+    )
+
+
+@pytest.mark.parametrize('data', [
+    {'nan': float('nan')},
+    {'values': [1.5, float('inf')]},
+    {'amount': decimal.Decimal('-Infinity'), 'profile_image': None},
+])
+def test_renderer_raises_on_non_finite_number_like_camel_case_json_renderer(data):
+    with pytest.raises(ValueError):
+        CamelCaseJSONRenderer().render(data)
+    with pytest.raises(ValueError):
+        OrjsonCamelCaseJSONRenderer().render(data)
+
+
+PARSE_CASES = [
+    b'{}',
+    b'[]',
+    b'null',
+    b'"string"',
+    '{"phoneNumber": "+821012345678", "name": "김헤어", "isRegistration": true}'.encode(),
+    b'{"address1": "a", "policyForTermsAgreed": null, "HTTPResponse": 1, "ab2Cd": 2, "a1B2": 3, "_private": 4}',
+    b'{"careerSet": [{"joinAt": "2020-01-01", "quitAt": null}, [1, 2.5, {"innerKey": 1}]]}',
+    b'{"bigInt": 1180591620717411303424, "nan": 1.5e300}',
+    b'{"dup": 1, "dup": 2}',
+]
+
+
+def parse(parser, body: bytes):
+    return parser.parse(io.BytesIO(body), 'application/json', {})
+
+
+@pytest.mark.parametrize('body', PARSE_CASES)
+def test_parser_result_matches_no_underscore_before_number_parser(body):
+    result = parse(OrjsonCamelCaseJSONParser(), body)
+    expected = parse(NoUnderscoreBeforeNumberCamelCaseJSONParser(), body)
+
+    assert result == expected
+    assert repr(result) == repr(expected)
+
+
+@pytest.mark.parametrize('body', [b'', b'{', b'{"a": }'])
+def test_parser_raises_parse_error(body):
+    with pytest.raises(ParseError):
+        parse(OrjsonCamelCaseJSONParser(), body)
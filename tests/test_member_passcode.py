@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.member.models import User, UserPasscodeVerify
+
+
+@pytest.mark.usefixtures('django_test_database')
+class UserPasscodeVerifyTestCase(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username='ozet_passcode', phone_number='+821012345678')
+
+    @contextmanager
+    def assertNumDataQueries(self, num):
+        """
+        트랜잭션 제어(BEGIN / SAVEPOINT) 쿼리를 제외한 쿼리 수를 확인
+        """
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if not query['sql'].startswith(('BEGIN', 'SAVEPOINT', 'RELEASE SAVEPOINT'))
+        ]
+        self.assertEqual(len(queries), num, '\n'.join(queries))
+
+    def request(self, passcode='123456'):
+        return UserPasscodeVerify.request(
+            self.user,
+            requester_phone_number=self.user.phone_number,
+            requester_device_uuid=self.user.username,
+            passcode=passcode,
+        )
+
+    def test_request_queries(self):
+        # 최근 요청 잠금 조회 + 생성
+        with self.assertNumDataQueries(2):
+            passcode_verify, created = self.request()
+
+        self.assertTrue(created)
+        self.assertEqual(passcode_verify.status, UserPasscodeVerify.Status.pending)
+
+    def test_request_pending(self):
+        pending, _ = self.request()
+
+        with self.assertNumDataQueries(1):
+            passcode_verify, created = self.request()
+
+        self.assertFalse(created)
+        self.assertEqual(passcode_verify.id, pending.id)
+
+    def test_request_after_expired(self):
+        expired, _ = self.request()
+        UserPasscodeVerify.objects.filter(id=expired.id).update(expire_at=timezone.now() - timedelta(seconds=1))
+
+        # 최근 요청 잠금 조회 + 만료 처리 + 생성
+        with self.assertNumDataQueries(3):
+            _, created = self.request()
+
+        self.assertTrue(created)
+        expired.refresh_from_db()
+        self.assertEqual(expired.status, UserPasscodeVerify.Status.expire)
+
+    def test_verify_queries(self):
+        self.request(passcode='123456')
+
+        # 최근 요청 잠금 조회 + 검증 완료 처리
+        with self.assertNumDataQueries(2):
+            passcode_verify, verified = UserPasscodeVerify.verify(self.user, '123456')
+
+        self.assertTrue(verified)
+        self.assertEqual(passcode_verify.status, UserPasscodeVerify.Status.verified)
+
+    def test_verify_invalid_passcode(self):
+        self.request(passcode='123456')
+
+        with self.assertNumDataQueries(1):
+            passcode_verify, verified = UserPasscodeVerify.verify(self.user, '654321')
+
+        self.assertFalse(verified)
+        self.assertEqual(passcode_verify.status, UserPasscodeVerify.Status.pending)
+
+    def test_verify_expired(self):
+        pending, _ = self.request(passcode='123456')
+        UserPasscodeVerify.objects.filter(id=pending.id).update(expire_at=timezone.now() - timedelta(seconds=1))
+
+        passcode_verify, verified = UserPasscodeVerify.verify(self.user, '123456')
+
+        self.assertFalse(verified)
+        self.assertEqual(passcode_verify.status, UserPasscodeVerify.Status.expire)
+
+    def test_verify_does_not_exist(self):
+        passcode_verify, verified = UserPasscodeVerify.verify(self.user, '123456')
+
+        self.assertFalse(verified)
+        self.assertIsNone(passcode_verify)
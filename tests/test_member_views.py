@@ -0,0 +1,35 @@
+import pytest
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from apps.member.models import User, UserSocial
+from apps.member.views import UserListView
+
+
+@pytest.mark.usefixtures('django_test_database')
+class UserListViewTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(60):
+            user, _ = User.objects.get_or_create_by_phone_number(f'+8210200000{i:02d}')
+            UserSocial.objects.create(user=user, social=UserSocial.Social.instagram, social_key=f'ozet_{i}')
+
+    def get(self, limit):
+        request = APIRequestFactory().get('/api/v1/member/user/', {'limit': limit})
+
+        with CaptureQueriesContext(connection) as context:
+            response = UserListView.as_view()(request)
+            response.render()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), limit)
+
+        return len(context.captured_queries)
+
+    def test_query_count_does_not_depend_on_limit(self):
+        # 회원 + 프로필 / 이력서 조회 + 소셜 계정 prefetch
+        self.assertEqual(self.get(limit=5), 2)
+        self.assertEqual(self.get(limit=50), 2)
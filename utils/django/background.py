@@ -0,0 +1,37 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# 요청 처리 흐름과 무관한 가벼운 작업(감사 로그 기록 등)을 순서대로 처리하는 프로세스 내 작업자
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ozet-background')
+
+
+def _run(func: Callable, *args, **kwargs):
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception('Background task %r failed', func)
+    finally:
+        close_old_connections()
+
+
+def run_in_background(func: Callable, *args, **kwargs) -> Future:
+    """
+    함수를 백그라운드 스레드에서 실행
+
+    Notes:
+        작업은 제출된 순서대로 하나의 스레드에서 실행되며, 실패하더라도 예외를 전파하지 않고 로그만 남깁니다.
+        BACKGROUND_TASK_ALWAYS_EAGER 가 설정되어 있으면 즉시 현재 스레드에서 실행합니다. (테스트 용도)
+    """
+    if getattr(settings, 'BACKGROUND_TASK_ALWAYS_EAGER', False):
+        future = Future()
+        future.set_result(func(*args, **kwargs))
+        return future
+
+    return _executor.submit(_run, func, *args, **kwargs)
@@ -1,28 +1,88 @@
-import copy
+from typing import List, Optional
 
 from django.db import models
+from django.db.models.fields.files import FieldFile
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from djchoices import ChoiceItem, DjangoChoices
 from model_utils.models import TimeStampedModel as BaseTimeStampedModel
 from safedelete.models import SafeDeleteModel as BaseSafeDeleteModel
 
 
 class TimeStampedModel(BaseTimeStampedModel):
+    """
+    Notes:
+        DB 에서 읽어온 필드 값을 보관해두고, update_fields 없이 저장할 경우 변경된 필드만 UPDATE 합니다.
+        변경된 필드가 없으면 저장하지 않습니다.
+        dict / list 값(JSONField 등)은 제자리 변경을 알 수 없으므로 항상 변경된 것으로 봅니다.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(TimeStampedModel, cls).from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super(TimeStampedModel, self).refresh_from_db(using=using, fields=fields)
+        self._snapshot_loaded_values(fields)
+
+    def _snapshot_loaded_values(self, update_fields=None):
+        loaded_values = self.__dict__.setdefault('_loaded_values', {})
+        for field in self._meta.concrete_fields:
+            if field.attname not in self.__dict__:
+                continue
+
+            if update_fields is not None and field.name not in update_fields and field.attname not in update_fields:
+                continue
+
+            value = getattr(self, field.attname)
+            # FieldFile 은 제자리에서 name 이 바뀌므로 name 만 보관
+            loaded_values[field.attname] = value.name if isinstance(value, FieldFile) else value
+
+    def get_dirty_fields(self) -> Optional[List[str]]:
+        """
+        DB 에서 읽어온 이후 변경된 필드 이름 목록 (DB 에서 읽어오지 않은 인스턴스는 None)
+        """
+        loaded_values = self.__dict__.get('_loaded_values')
+        if loaded_values is None:
+            return None
+
+        dirty_fields = []
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname not in self.__dict__:
+                continue
+
+            value = getattr(self, field.attname)
+            if field.attname not in loaded_values or \
+                    isinstance(value, (dict, list)) or \
+                    (isinstance(value, FieldFile) and not value._committed) or \
+                    value != loaded_values[field.attname]:
+                dirty_fields.append(field.name)
+
+        return dirty_fields
 
     def save(self, *args, **kwargs):
         # Created
-        if not self.id:
-            return super(TimeStampedModel, self).save(*args, **kwargs)
+        if self._state.adding or not self.pk or args:
+            rv = super(TimeStampedModel, self).save(*args, **kwargs)
+            self._snapshot_loaded_values()
+            return rv
 
-        if 'update_fields' not in kwargs:
-            return super(TimeStampedModel, self).save(*args, **kwargs)
+        if kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            dirty_fields = self.get_dirty_fields()
+            if dirty_fields is not None:
+                if not dirty_fields:
+                    return
 
-        if not kwargs['update_fields']:
-            return super(TimeStampedModel, self).save(*args, **kwargs)
+                kwargs['update_fields'] = dirty_fields
 
-        new_kwargs = copy.deepcopy(kwargs)
-        if isinstance(new_kwargs['update_fields'], tuple):
-            new_kwargs['update_fields'] = list(new_kwargs['update_fields'])
-        new_kwargs['update_fields'].append('modified')
-        return super(TimeStampedModel, self).save(*args, **new_kwargs)
+        # modified 는 BaseTimeStampedModel.save 에서 update_fields 에 추가됨
+        rv = super(TimeStampedModel, self).save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        self._snapshot_loaded_values(set(update_fields) | {'modified'} if update_fields else None)
+        return rv
 
     class Meta:
         abstract = True
@@ -41,4 +101,44 @@ class SafeDeleteModel(BaseSafeDeleteModel):
 
     @property
     def is_deleted(self):
-        return self.deleted is not None
\ No newline at end of file
+        return self.deleted is not None
+
+class QueuedTaskModel(TimeStampedModel):
+    """
+    utils.django.workers.QueueWorker 로 처리되는 작업 모델
+    """
+    class Status(DjangoChoices):
+        queued = ChoiceItem('queued', label=_('대기중'))
+        processing = ChoiceItem('processing', label=_('처리중'))
+        done = ChoiceItem('done', label=_('완료됨'))
+        failed = ChoiceItem('failed', label=_('실패함'))
+
+    status = models.CharField(
+        null=False,
+        blank=False,
+        max_length=20,
+        default=Status.queued,
+        choices=Status.choices,
+        verbose_name=_('처리 상태'),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        null=False,
+        blank=False,
+        default=0,
+        verbose_name=_('시도 횟수'),
+    )
+    next_attempt_at = models.DateTimeField(
+        null=False,
+        blank=False,
+        default=timezone.now,
+        verbose_name=_('다음 시도 시간'),
+    )
+    last_error = models.TextField(
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_('마지막 에러'),
+    )
+
+    class Meta:
+        abstract = True
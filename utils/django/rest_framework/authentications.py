@@ -1,12 +1,17 @@
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.utils.translation import ugettext as _
 from rest_framework import exceptions
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.request import Request
 from rest_framework_jwt.authentication import (
     JSONWebTokenAuthentication as BaseJSONWebTokenAuthentication,
+    jwt_get_username_from_payload,
 )
 
+from apps.member.caches import UserCache
+
 
 class SwaggerTokenAuthentication(BaseAuthentication):
     api_key_name = "HTTP_OZET_SWAGGER_API_KEY"
@@ -26,6 +31,38 @@ class SwaggerTokenAuthentication(BaseAuthentication):
 
 
 class JSONWebTokenAuthentication(BaseJSONWebTokenAuthentication):
+    def authenticate_credentials(self, payload):
+        """
+        회원 캐시를 우선 조회하고, 없을 경우 프로필 / 이력서를 함께 조회해서 캐시에 저장
+        """
+        self.payload = payload
+
+        User = get_user_model()
+        username = jwt_get_username_from_payload(payload)
+        user_id = payload.get('user_id')
+
+        if not username or not user_id:
+            raise exceptions.AuthenticationFailed(_('Invalid payload.'))
+
+        version = UserCache.get_version(user_id)
+        user = UserCache.get(user_id, version) if version is not None else None
+
+        if user is None or user.username != username:
+            try:
+                user = User.objects \
+                    .select_related('profile', 'resume') \
+                    .get(username=username)
+            except User.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid signature.'))
+
+            if version is not None and user.id == user_id:
+                UserCache.set(user, version)
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User account is disabled.'))
+
+        return user
+
     def authenticate(self, request: Request):
         try:
             rv = super(JSONWebTokenAuthentication, self).authenticate(request)
@@ -41,5 +78,6 @@ class JSONWebTokenAuthentication(BaseJSONWebTokenAuthentication):
             raise exceptions.AuthenticationFailed()
 
         request.jwt_value = jwt_value
+        request.jwt_payload = self.payload
 
         return rv
@@ -42,6 +42,16 @@ def jwt_payload_handler(user):
 
     payload[username_field] = username
 
+    # 매 요청마다 연관 객체를 조회하지 않도록 식별자를 함께 담음
+    resume = getattr(user, 'resume', None)
+    profile = getattr(user, 'profile', None)
+    payload['resume_id'] = resume.pk if resume else None
+    payload['profile_id'] = profile.pk if profile else None
+    payload['is_registration'] = getattr(user, 'is_registration', False)
+
+    # 같은 시각에 발급된 토큰도 서로 구분되도록 고유 식별자를 담음
+    payload['jti'] = uuid.uuid4().hex
+
     # Include original issued at time for a brand new token,
     # to allow token refresh
     if api_settings.JWT_ALLOW_REFRESH:
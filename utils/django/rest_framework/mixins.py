@@ -1,3 +1,5 @@
+from urllib.parse import urlencode
+
 from django.utils.functional import cached_property
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -84,6 +86,37 @@ class UserContextMixin(APIView):
                 return user
         return None
 
+    @cached_property
+    def jwt_payload(self) -> dict:
+        # 인증이 먼저 수행되어야 request 에 payload 가 할당됨
+        if not self.user:
+            return {}
+
+        return getattr(self.request, 'jwt_payload', None) or {}
+
+    @cached_property
+    def resume_id(self):
+        """
+        JWT 의 resume_id claim 을 신뢰하고, claim 이 없는 이전 토큰일 경우에만 연관 객체를 조회
+        """
+        if resume_id := self.jwt_payload.get('resume_id'):
+            return resume_id
+
+        if not self.user:
+            return None
+
+        return self.user.resume.id
+
+    @cached_property
+    def profile_id(self):
+        if profile_id := self.jwt_payload.get('profile_id'):
+            return profile_id
+
+        if not self.user:
+            return None
+
+        return self.user.profile.id
+
     def get_serializer_context(self):
         if not hasattr(super(UserContextMixin, self), 'get_serializer_context'):
             return
@@ -129,3 +162,55 @@ class QuerySerializerMixin(object):
         serializer.is_valid(raise_exception=True)
 
         return serializer.validated_data
+
+
+class VersionedResponseCacheMixin(object):
+    """
+    소유자별 버전 키를 가진 조회(retrieve) 응답 캐시
+
+    Notes:
+        response_cache_class 는 get_version / get / set classmethod 를 가진 캐시 클래스입니다.
+        DB 조회 전에 가져온 버전으로 저장하므로 조회 도중 발생한 변경이 이전 버전의 응답으로 덮어써지지 않습니다.
+        소유자를 알 수 없거나(None) 조회에 실패한 응답, 캐시 장애로 버전을 알 수 없는 경우는 캐시되지 않습니다.
+        임의의 query string 으로 캐시 키가 늘어나지 않도록 response_cache_query_params 에 지정된 파라미터만 키에 포함합니다.
+    """
+    response_cache_class = None
+    response_cache_query_params = ()
+
+    def get_response_cache_owner_id(self):
+        raise NotImplementedError('`get_response_cache_owner_id()` must be implemented.')
+
+    def get_response_cache_url(self, request) -> str:
+        """
+        파일 URL 이 요청 host 로 만들어지므로 host 를 포함한 URL 을 키로 사용
+        """
+        url = request.build_absolute_uri(request.path)
+
+        params = [
+            (name, request.query_params[name])
+            for name in self.response_cache_query_params
+            if name in request.query_params
+        ]
+        if params:
+            url = f'{url}?{urlencode(params)}'
+
+        return url
+
+    def retrieve(self, request, *args, **kwargs):
+        owner_id = self.get_response_cache_owner_id()
+        version = self.response_cache_class.get_version(owner_id) if owner_id is not None else None
+        if version is None:
+            # noinspection PyUnresolvedReferences
+            return super(VersionedResponseCacheMixin, self).retrieve(request, *args, **kwargs)
+
+        url = self.get_response_cache_url(request)
+
+        data = self.response_cache_class.get(owner_id, version, url)
+        if data is not None:
+            return Response(data)
+
+        # noinspection PyUnresolvedReferences
+        response = super(VersionedResponseCacheMixin, self).retrieve(request, *args, **kwargs)
+        self.response_cache_class.set(owner_id, version, url, response.data)
+
+        return response
@@ -0,0 +1,88 @@
+import logging
+from typing import Dict
+
+from django.core.cache import cache as default_cache
+from rest_framework.throttling import SimpleRateThrottle
+
+logger = logging.getLogger(__name__)
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    캐시 기반 sliding window 요청 제한
+
+    Notes:
+        요청 기록 목록을 저장하는 SimpleRateThrottle 대신, 현재 / 직전 고정 창의 카운터만 저장하고
+        직전 창의 카운터를 현재 창의 경과 비율만큼 줄여 더한 값으로 sliding window 의 요청 수를 근사합니다.
+        허용 / 거부된 요청 수는 scope 별 카운터로 남아 get_stats 로 조회할 수 있습니다.
+    """
+    cache = default_cache
+    cache_format = 'throttle:%(scope)s:%(ident)s'
+    stats_key_format = 'throttle:stats:%(scope)s:%(result)s'
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window, elapsed = divmod(self.now, self.duration)
+        self.elapsed_ratio = elapsed / self.duration
+
+        current_key = f'{self.key}:{int(window)}'
+        previous_key = f'{self.key}:{int(window) - 1}'
+
+        counts = self.cache.get_many([previous_key, current_key])
+        self.previous_count = counts.get(previous_key, 0)
+        self.current_count = counts.get(current_key, 0)
+
+        if self.get_estimated_count() + 1 > self.num_requests:
+            return self.throttle_failure()
+
+        # 직전 창의 카운터가 다음 창에서도 사용되므로 두 창 길이만큼 유지
+        self.cache.add(current_key, 0, timeout=self.duration * 2)
+        try:
+            self.current_count = self.cache.incr(current_key)
+        except ValueError:
+            self.cache.set(current_key, 1, timeout=self.duration * 2)
+            self.current_count = 1
+
+        return self.throttle_success()
+
+    def get_estimated_count(self) -> float:
+        return self.previous_count * (1 - self.elapsed_ratio) + self.current_count
+
+    def throttle_success(self):
+        self.record_stat('allowed')
+        return True
+
+    def throttle_failure(self):
+        self.record_stat('rejected')
+        logger.info('Throttled %s (%.1f/%d)', self.key, self.get_estimated_count(), self.num_requests)
+        return False
+
+    def wait(self):
+        # 직전 창의 요청이 충분히 빠져나갈 때까지 남은 시간 (최대 현재 창의 남은 시간)
+        return self.duration * (1 - self.elapsed_ratio)
+
+    def record_stat(self, result: str) -> None:
+        key = self.stats_key_format % {'scope': self.scope, 'result': result}
+
+        self.cache.add(key, 0, timeout=None)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, 1, timeout=None)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        keys = {
+            result: cls.stats_key_format % {'scope': cls.scope, 'result': result}
+            for result in ('allowed', 'rejected')
+        }
+        values = cls.cache.get_many(list(keys.values()))
+
+        return {result: values.get(key, 0) for result, key in keys.items()}
@@ -0,0 +1,172 @@
+import logging
+import time
+from datetime import timedelta
+from typing import List, Optional
+
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q, QuerySet
+from django.utils import timezone
+
+from utils.django.models import QueuedTaskModel
+
+logger = logging.getLogger(__name__)
+
+
+class QueueWorker(object):
+    """
+    QueuedTaskModel 작업 처리기
+
+    Notes:
+        대기중인 작업을 select_for_update(skip_locked) 로 가져와 처리중 상태로 전환한 뒤 잠금을 해제하므로,
+        여러 작업자 프로세스가 같은 테이블을 동시에 처리할 수 있습니다.
+        처리중 상태로 stale_timeout 이상 남아있는 작업은 작업자가 비정상 종료된 것으로 보고 다시 가져오며,
+        이미 max_attempts 번 시도한 작업은 실패 처리합니다.
+        실패한 작업은 지수 백오프로 재시도하며, max_attempts 를 넘으면 실패 상태로 남깁니다.
+    """
+    model = None
+    batch_size = 10
+    max_attempts = 5
+    backoff_base = timedelta(seconds=5)
+    backoff_max = timedelta(minutes=10)
+    stale_timeout = timedelta(minutes=5)
+    poll_interval = 1.0
+
+    def __init__(self, batch_size: Optional[int] = None):
+        assert self.model is not None, (
+            "'%s' should include a `model` attribute." % self.__class__.__name__
+        )
+
+        if batch_size:
+            self.batch_size = batch_size
+
+    def get_queryset(self) -> QuerySet:
+        return self.model.objects.all()
+
+    def get_backoff(self, attempts: int) -> timedelta:
+        return min(self.backoff_base * (2 ** max(attempts - 1, 0)), self.backoff_max)
+
+    def claim(self) -> List[QueuedTaskModel]:
+        Status = QueuedTaskModel.Status
+
+        while True:
+            now = timezone.now()
+
+            with transaction.atomic():
+                tasks = list(
+                    self.get_queryset()
+                    .select_for_update(skip_locked=True)
+                    .filter(
+                        Q(status=Status.queued, next_attempt_at__lte=now) |
+                        Q(status=Status.processing, modified__lt=now - self.stale_timeout)
+                    )
+                    .order_by('next_attempt_at')[:self.batch_size]
+                )
+                if not tasks:
+                    return []
+
+                # 처리중에 작업자가 종료되는 작업(프로세스를 죽이는 입력 등)이 계속 다시 가져와지지 않도록 함
+                claimed_tasks = []
+                for task in tasks:
+                    if task.status == Status.processing and task.attempts >= self.max_attempts:
+                        self.fail(task, 'processing timed out', retry=False)
+                    else:
+                        claimed_tasks.append(task)
+
+                if claimed_tasks:
+                    self.model.objects \
+                        .filter(id__in=[task.id for task in claimed_tasks]) \
+                        .update(
+                            status=Status.processing,
+                            attempts=F('attempts') + 1,
+                            modified=now,
+                        )
+
+            if claimed_tasks:
+                break
+
+        for task in claimed_tasks:
+            task.status = Status.processing
+            task.attempts += 1
+            task.modified = now
+
+        return claimed_tasks
+
+    def process(self, tasks: List[QueuedTaskModel]) -> None:
+        """
+        작업을 처리하고 각 작업에 대해 succeed 또는 fail 을 호출
+        """
+        raise NotImplementedError
+
+    def succeed(self, task: QueuedTaskModel, update_fields: Optional[List[str]] = None) -> None:
+        task.status = QueuedTaskModel.Status.done
+        task.last_error = None
+        task.save(update_fields=['status', 'last_error'] + (update_fields or []))
+
+    def succeed_many(self, tasks: List[QueuedTaskModel], **fields) -> None:
+        """
+        여러 작업을 한 번의 UPDATE 로 완료 처리
+
+        Args:
+            tasks: 완료된 작업 목록
+            fields: 함께 갱신할 필드 값
+        """
+        if not tasks:
+            return
+
+        self.model.objects \
+            .filter(id__in=[task.id for task in tasks]) \
+            .update(
+                status=QueuedTaskModel.Status.done,
+                last_error=None,
+                modified=timezone.now(),
+                **fields,
+            )
+
+        for task in tasks:
+            task.status = QueuedTaskModel.Status.done
+            task.last_error = None
+            for field, value in fields.items():
+                setattr(task, field, value)
+
+    def fail(self, task: QueuedTaskModel, error: str, retry=True) -> None:
+        task.last_error = error
+
+        if retry and task.attempts < self.max_attempts:
+            task.status = QueuedTaskModel.Status.queued
+            task.next_attempt_at = timezone.now() + self.get_backoff(task.attempts)
+        else:
+            task.status = QueuedTaskModel.Status.failed
+            self.on_failed(task)
+
+        task.save(update_fields=['status', 'last_error', 'next_attempt_at'])
+
+    def on_failed(self, task: QueuedTaskModel) -> None:
+        """
+        재시도 없이 최종 실패 처리될 때 호출
+        """
+        pass
+
+    def run_once(self) -> int:
+        tasks = self.claim()
+        if not tasks:
+            return 0
+
+        try:
+            self.process(tasks)
+        except Exception as e:
+            logger.exception('%s failed to process %d tasks', self.__class__.__name__, len(tasks))
+            for task in tasks:
+                if task.status == QueuedTaskModel.Status.processing:
+                    self.fail(task, repr(e))
+
+        return len(tasks)
+
+    def run(self, stop_when_empty=False) -> None:
+        while True:
+            close_old_connections()
+            processed_count = self.run_once()
+
+            if not processed_count:
+                if stop_when_empty:
+                    break
+                time.sleep(self.poll_interval)
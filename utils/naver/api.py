@@ -1,6 +1,9 @@
 import re
+import logging
+import threading
+from functools import lru_cache
 
-from typing import Union, Literal, Optional
+from typing import Union, Literal, List, Optional, TypedDict
 
 from phonenumber_field.serializerfields import PhoneNumberField
 from phonenumber_field.phonenumber import PhoneNumber
@@ -12,6 +15,11 @@ import hmac
 import base64
 
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
 
 PROJECT_SERVICE_ID = "ncp:sms:kr:256400342331:ozet_sms_module"
 ACCESS_KEY = "9h0R0dOkMEGRNAOTTthX"
@@ -19,15 +27,51 @@ SECRET_KEY = "1eHqKPKw0F2LDBteRTILWOwVCkQixo8x2WrUE722"
 
 CALLER_ID = '01057809397'
 
+API_HOST = 'https://sens.apigw.ntruss.com'
+
+# (connect, read) timeout 초
+TIMEOUT = (3.05, 10)
+
+# 한 번의 요청으로 발송 가능한 최대 수신자 수
+SMS_MAX_RECIPIENTS = 100
+
+# 연결 자체가 실패한 경우에만 재시도 (요청이 전송된 이후의 재시도는 중복 발송이 될 수 있음)
+CONNECT_RETRIES = 2
+POOL_MAXSIZE = 10
+
 
 def is_valid_phonenumber(phone_number: str) -> bool:
     return bool(re.match('\d{2,3}\d{3,4}\d{4}', phone_number))
 
 
+def normalize_phone_number(phone_number: Union[str, PhoneNumber]) -> str:
+    """
+    SENS 수신번호 형식(하이픈 없는 국내 번호)으로 변환
+
+    Raises:
+        ValueError: 유효하지 않은 전화번호
+    """
+    if isinstance(phone_number, PhoneNumber):
+        phone_number = str(phone_number.as_national.replace('-', ''))
+
+    if not is_valid_phonenumber(phone_number):
+        raise ValueError
+
+    return phone_number
+
+
 def get_timestamp():
     return str(int(time.time() * 1000))
 
 
+@lru_cache(maxsize=8)
+def get_signing_hmac(secret_key: str) -> hmac.HMAC:
+    """
+    secret key 로 초기화된 HMAC 객체 (호출마다 copy 해서 사용)
+    """
+    return hmac.new(bytes(secret_key, 'UTF-8'), digestmod=hashlib.sha256)
+
+
 def make_signature(
         method: Literal['POST', 'GET'],
         uri: str,
@@ -51,17 +95,128 @@ def make_signature(
     Notes:
 
     """
-    secret_key = bytes(secret_key, 'UTF-8')
-
     message = method + " " + uri + "\n" + timestmap + "\n" + access_key
     message = bytes(message, 'UTF-8')
 
-    siging_key = base64.b64encode(hmac.new(secret_key, message, digestmod=hashlib.sha256).digest())
+    signing_hmac = get_signing_hmac(secret_key).copy()
+    signing_hmac.update(message)
+    siging_key = base64.b64encode(signing_hmac.digest())
 
     return siging_key
 
 
+class SMSRecipient(TypedDict):
+    phone_number: Union[str, PhoneNumber]
+    subject: Optional[str]
+    message: str
+
+
+class APIMetrics(object):
+    """
+    프로세스 내 API 호출 지표 (호출 수 / 에러 수 / 지연 시간)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.error_count = 0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+
+    def record(self, latency: float, is_error: bool) -> None:
+        with self._lock:
+            self.count += 1
+            self.error_count += int(is_error)
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(
+                count=self.count,
+                error_count=self.error_count,
+                avg_latency=self.total_latency / self.count if self.count else 0.0,
+                max_latency=self.max_latency,
+            )
+
+
+def is_request_not_sent(e: requests.RequestException) -> bool:
+    """
+    요청이 전송되기 전에 실패했는지 확인 (연결 실패 / 연결 시간 초과)
+
+    Notes:
+        응답 시간 초과 등 요청이 전송된 이후의 실패는 서버가 요청을 처리했을 수 있으므로 False 를 반환합니다.
+    """
+    if isinstance(e, requests.ConnectTimeout):
+        return True
+
+    if isinstance(e, requests.ConnectionError) and e.args:
+        return isinstance(getattr(e.args[0], 'reason', None), NewConnectionError)
+
+    return False
+
+
+def create_session() -> requests.Session:
+    retry = Retry(
+        total=CONNECT_RETRIES,
+        connect=CONNECT_RETRIES,
+        read=0,
+        redirect=0,
+        status=0,
+        other=0,
+        backoff_factor=0.2,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
+
+
 class NaverCloudAPI(object):
+    metrics = APIMetrics()
+
+    _session = None
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        keep-alive 연결을 재사용하는 공용 세션
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = create_session()
+        return cls._session
+
+    @classmethod
+    def request(cls, method: Literal['POST', 'GET'], uri: str, **kwargs) -> Response:
+        timestamp = get_timestamp()
+        key = make_signature(method, uri, timestamp)
+        headers = {
+            'Content-Type': 'application/json; charset=utf-8',
+            'x-ncp-apigw-timestamp': timestamp,
+            'x-ncp-iam-access-key': ACCESS_KEY,
+            'x-ncp-apigw-signature-v2': key
+        }
+
+        started_at = time.monotonic()
+        is_error = True
+        try:
+            res = cls.get_session().request(method, f'{API_HOST}{uri}', headers=headers, timeout=TIMEOUT, **kwargs)
+            is_error = res.status_code >= 400
+            return res
+        finally:
+            latency = time.monotonic() - started_at
+            cls.metrics.record(latency, is_error)
+            logger.info('Naver API %s %s took %.3fs (error=%s)', method, uri, latency, is_error)
+
     @classmethod
     def send_sms(
             cls,
@@ -83,40 +238,72 @@ class NaverCloudAPI(object):
         Notes:
 
         """
-        if isinstance(phone_number, PhoneNumber):
-            phone_number = str(phone_number.as_national.replace('-', ''))
+        return cls.send_sms_bulk([
+            SMSRecipient(phone_number=phone_number, subject=subject, message=message),
+        ])
+
+    @classmethod
+    def send_sms_bulk(cls, recipients: List[SMSRecipient]) -> Response:
+        """
+        Naver SMS 문자 일괄 발송
+
+        Args:
+            recipients: 수신자별 전화번호 / 제목 / 내용 (최대 SMS_MAX_RECIPIENTS 건)
 
-        if not is_valid_phonenumber(phone_number):
-            raise ValueError
+        Returns:
+            response: 네이버 API 응답
+
+        Notes:
+            SENS 는 요청 단위로 접수 결과(202)와 requestId 를 반환하며,
+            수신자별 결과는 get_sms_request / get_sms_result 로 조회합니다.
+        """
+        if not recipients or len(recipients) > SMS_MAX_RECIPIENTS:
+            raise ValueError(f'recipients must be between 1 and {SMS_MAX_RECIPIENTS}')
 
-        #  URL
-        url = f'https://sens.apigw.ntruss.com/sms/v2/services/{PROJECT_SERVICE_ID}/messages'
+        messages = [
+            {
+                "to": normalize_phone_number(recipient['phone_number']),
+                "subject": recipient.get('subject'),
+                "content": recipient['message'],
+            }
+            for recipient in recipients
+        ]
 
         # uri
         uri = f'/sms/v2/services/{PROJECT_SERVICE_ID}/messages'
-        timestamp = get_timestamp()
 
         body = {
             "type": "SMS",
             "contentType": "COMM",
             "countryCode": "82",
             "from": CALLER_ID,
-            "content": message,
-            "messages": [
-                {
-                    "to": phone_number,
-                    "subject": subject,
-                    "content": message
-                }
-            ]
+            # 수신자별 content 가 없을 때 사용되는 기본 내용
+            "content": messages[0]['content'],
+            "messages": messages,
         }
 
-        key = make_signature('POST', uri, timestamp)
-        headers = {
-            'Content-Type': 'application/json; charset=utf-8',
-            'x-ncp-apigw-timestamp': timestamp,
-            'x-ncp-iam-access-key': ACCESS_KEY,
-            'x-ncp-apigw-signature-v2': key
-        }
+        return cls.request('POST', uri, json=body)
+
+    @classmethod
+    def get_sms_request(cls, request_id: str) -> Response:
+        """
+        Naver SMS 발송 요청 조회 (수신자별 messageId / 수신번호)
+
+        Args:
+            request_id: send_sms / send_sms_bulk 응답의 requestId
+        """
+        uri = f'/sms/v2/services/{PROJECT_SERVICE_ID}/messages?requestId={request_id}'
+
+        return cls.request('GET', uri)
+
+    @classmethod
+    def get_sms_result(cls, message_id: str) -> Response:
+        """
+        Naver SMS 발송 결과 조회 (status: READY / PROCESSING / COMPLETED, statusName: success / fail)
+
+        Args:
+            message_id: get_sms_request 응답의 수신자별 messageId
+        """
+        uri = f'/sms/v2/services/{PROJECT_SERVICE_ID}/messages/{message_id}'
 
-        return requests.post(url, json=body, headers=headers)
+        return cls.request('GET', uri)